@@ -0,0 +1,81 @@
+"""
+Benchmark HTML index generation with and without the row fragment cache
+
+Builds synthetic project records, then times a full render without the
+cache, a cold run that fills the cache, and warm runs where a handful of
+projects changed since the last run.
+
+    python benchmarks/bench_html_index.py [--projects 100000] [--changes 5]
+"""
+
+import os
+import sys
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from codedoc.index import create_html_index
+
+def make_project(i):
+    path = f'/srv/code/team-{i % 50}/project-{i:06d}'
+    return {
+        'name': f'project-{i:06d}',
+        'path': path,
+        'type': 'Python',
+        'language': 'Python',
+        'status': 'Active',
+        'last_modified': '2026-10-01',
+        'description': f'Service {i} that <handles> requests & keeps a queue of jobs for team {i % 50}.\n' * 2,
+        'git': {'commits': i % 900, 'active_authors': i % 7, 'first_commit': '2021-03-04',
+                'last_commit': '2026-09-30', 'churn': i * 13 % 50000},
+        'size': {'total_bytes': i * 4099, 'file_count': i % 400, 'binary_count': i % 3, 'binary_bytes': 0,
+                 'largest': [{'path': 'data/fixtures.json', 'bytes': i * 97}], 'oversized': []},
+        'gitignore_preview': None,
+        'dependencies': {'pypi': {'requests': '>=2'}},
+        'fingerprint': f'{1700000000000000000 + i}|{1600000000000000000 + i}|{i % 4096}|{i:040x}'
+    }
+
+def change(project, run):
+    project['description'] = f'Changed in run {run}.'
+    project['fingerprint'] += f'|run{run}'
+
+def timed(label, fn):
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f'{label:<28} {elapsed:7.3f}s')
+    return elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark create_html_index')
+    parser.add_argument('--projects', type=int, default=100000)
+    parser.add_argument('--changes', type=int, default=5)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    projects = [make_project(i) for i in range(args.projects)]
+    work_dir = tempfile.mkdtemp(prefix='codedoc-bench-')
+    try:
+        output = os.path.join(work_dir, 'project_index.html')
+        cache = os.path.join(work_dir, '.project_index.html.rows')
+        print(f'{args.projects} projects, {args.changes} changed per warm run')
+
+        timed('no cache', lambda: create_html_index(projects, output))
+        timed('cold cache', lambda: create_html_index(projects, output, cache))
+        step = max(len(projects) // max(args.changes, 1), 1)
+        for run in range(1, args.runs + 1):
+            for project in projects[run::step][:args.changes]:
+                change(project, run)
+            timed(f'warm cache, run {run}', lambda: create_html_index(projects, output, cache))
+        timed('no cache', lambda: create_html_index(projects, output))
+    finally:
+        shutil.rmtree(work_dir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+"""
+codedoc: scan a directory of code projects and build an index of them
+
+Library use:
+
+    from codedoc import iter_projects, JsonFileCache
+
+    cache = JsonFileCache('.codedoc-cache.json')
+    for record in iter_projects(['~/code'], cache=cache):
+        ...
+    cache.save()
+"""
+
+from .cache import MemoryCache, JsonFileCache
+from .scanner import scan_project, discover_projects, iter_projects
+from .index import create_html_index, create_json_index
+
+__all__ = [
+    'MemoryCache',
+    'JsonFileCache',
+    'scan_project',
+    'discover_projects',
+    'iter_projects',
+    'create_html_index',
+    'create_json_index',
+]
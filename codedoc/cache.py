@@ -0,0 +1,54 @@
+"""
+Scan caches
+
+A cache stores JSON-serializable values under a namespace and key. Any
+object with the same get/set/save methods can be passed to the scanner,
+so long-running processes can keep one warm cache across many scans.
+"""
+
+import json
+import os
+
+class MemoryCache:
+    """Cache held in memory for the lifetime of the object."""
+
+    def __init__(self, data=None):
+        self.data = data if data is not None else {}
+
+    def get(self, namespace, key, default=None):
+        """Return the cached value for key in namespace, or default."""
+        return self.data.get(namespace, {}).get(key, default)
+
+    def set(self, namespace, key, value):
+        """Store a value for key in namespace."""
+        self.data.setdefault(namespace, {})[key] = value
+
+    def save(self):
+        """Persist the cache. Memory caches have nothing to write."""
+        pass
+
+class JsonFileCache(MemoryCache):
+    """Cache loaded from and saved to a JSON file."""
+
+    def __init__(self, path):
+        super().__init__(self._load(path))
+        self.path = path
+
+    @staticmethod
+    def _load(path):
+        """Load the cache file, returning an empty cache if it is missing or unreadable."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return data
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def save(self):
+        """Write the cache to disk, replacing the old file atomically."""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.data, f)
+        os.replace(tmp_path, self.path)
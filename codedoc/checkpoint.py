@@ -0,0 +1,99 @@
+"""
+Checkpoint journal for resuming interrupted scans
+
+Each completed project is appended to the journal as one JSON line. Writes
+are buffered and fsynced in batches, so checkpointing costs one sync per
+batch rather than one per project. A line torn by a crash is discarded
+when the journal is reopened, and the journal is removed once a run has
+written its outputs, so a later --resume starts from scratch.
+"""
+
+import os
+import json
+import time
+
+DEFAULT_CHECKPOINT = '.codedoc-checkpoint.jsonl'
+
+# Sync after this many records, or this many seconds, whichever comes first
+SYNC_EVERY = 64
+SYNC_INTERVAL = 2.0
+
+def load_journal(path):
+    """Read completed project records from a journal, keyed by absolute project path.
+
+    Returns (records, valid_length), where valid_length is the byte offset just past the
+    last complete line.
+    """
+    records = {}
+    valid_length = 0
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return records, 0
+    with f:
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            records[os.path.abspath(record['path'])] = record
+            valid_length += len(line)
+    return records, valid_length
+
+class CheckpointJournal:
+    """Append-only journal of completed project records."""
+
+    def __init__(self, path=DEFAULT_CHECKPOINT, resume=False, sync_every=SYNC_EVERY, sync_interval=SYNC_INTERVAL,
+                 before_sync=None, overwrite=False):
+        self.path = path
+        # Called before each sync, to commit state the journaled records depend on
+        self.before_sync = before_sync
+        self.sync_every = sync_every
+        self.sync_interval = sync_interval
+        self.completed = {}
+
+        if resume:
+            self.completed, valid_length = load_journal(path)
+            self.file = open(path, 'ab')
+            # Drop a partially written last line so new records start on a fresh line
+            self.file.truncate(valid_length)
+        else:
+            # Starting over would silently discard an interrupted run's progress
+            if not overwrite and os.path.exists(path) and os.path.getsize(path) > 0:
+                raise FileExistsError(f"Checkpoint journal {path} already has records; resume from it or overwrite it")
+            self.file = open(path, 'wb')
+
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, record):
+        """Record a completed project."""
+        self.file.write(json.dumps(record).encode('utf-8') + b'\n')
+        self._pending += 1
+        if self._pending >= self.sync_every or time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self):
+        """Flush buffered records to stable storage."""
+        if self.before_sync:
+            self.before_sync()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        """Sync outstanding records and close the journal."""
+        if not self.file.closed:
+            self.sync()
+            self.file.close()
+
+    def discard(self):
+        """Close and delete the journal after a run has completed."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
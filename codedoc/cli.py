@@ -0,0 +1,241 @@
+"""
+Command-line interface
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+from .cache import JsonFileCache, MemoryCache
+from .checkpoint import DEFAULT_CHECKPOINT, CheckpointJournal
+from .github import create_github_repos, DEFAULT_CONCURRENCY
+from .index import create_html_index, create_json_index
+from .scanner import iter_projects
+from .progress import ProgressReporter
+from .manifests import (DEFAULT_DEPS_INDEX, build_dependency_index, save_dependency_index,
+                        load_dependency_index, lookup_dependency)
+from .search import DEFAULT_SEARCH_INDEX, ReadmeIndex
+from .sizes import DEFAULT_MAX_FILE_SIZE
+
+logger = logging.getLogger(__name__)
+
+def search_main(argv):
+    """Search indexed READMEs: codedoc search QUERY."""
+    parser = argparse.ArgumentParser(prog='codedoc search', description="Search project READMEs")
+    parser.add_argument('query', nargs='+', help='Words to search for (FTS5 query syntax is accepted)')
+    parser.add_argument('--index', default=DEFAULT_SEARCH_INDEX, help=f'Search index file (default: {DEFAULT_SEARCH_INDEX})')
+    parser.add_argument('-n', '--limit', type=int, default=20, help='Maximum number of results')
+    args = parser.parse_args(argv)
+    
+    # Opening a missing file would create an empty index and hide a wrong path
+    if not os.path.isfile(args.index):
+        sys.exit(f"No search index at {args.index}; run a scan with --search-index to build one")
+    index = ReadmeIndex(args.index)
+    try:
+        results = index.search(' '.join(args.query), args.limit)
+    finally:
+        index.close()
+    
+    for result in results:
+        print(f"{result['score']:8.3f}  {result['name']}  ({result['path']})")
+        print(f"          {' '.join(result['snippet'].split())}")
+    if not results:
+        print("No matching projects")
+
+def deps_main(argv):
+    """Look up dependency users: codedoc deps NAME."""
+    parser = argparse.ArgumentParser(prog='codedoc deps', description="Find projects that declare a dependency")
+    parser.add_argument('name', nargs='+', help="Dependency name, optionally as ecosystem:name (e.g. npm:lodash)")
+    parser.add_argument('--index', default=DEFAULT_DEPS_INDEX, help=f'Dependency index file (default: {DEFAULT_DEPS_INDEX})')
+    parser.add_argument('--version', help='Only show declarations whose version contains this text')
+    args = parser.parse_args(argv)
+    
+    try:
+        index = load_dependency_index(args.index)
+    except (OSError, ValueError) as e:
+        sys.exit(f"Could not read dependency index {args.index} ({e}); run a scan with --deps-index to build one")
+    for name in args.name:
+        matches = lookup_dependency(index, name)
+        if not matches:
+            print(f"{name}: not used by any project")
+        for key, users in matches.items():
+            if args.version:
+                users = [u for u in users if args.version in u['version']]
+            print(f"{key}: {len(users)} project(s)")
+            for user in users:
+                print(f"  {user['project']}  {user['version'] or '(any)'}  ({user['path']})")
+
+# Subcommands take precedence over a project directory of the same name
+SUBCOMMANDS = {
+    'search': search_main,
+    'deps': deps_main
+}
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in SUBCOMMANDS:
+        return SUBCOMMANDS[argv[0]](argv[1:])
+    
+    # Set up argument parser
+    parser = argparse.ArgumentParser(description="Generate HTML index of code projects",
+                                     epilog="Run 'search QUERY' instead of a directory to search indexed READMEs, "
+                                            "or 'deps NAME' to find projects that declare a dependency.")
+    parser.add_argument('directory', help='Directory containing projects')
+    parser.add_argument('-o', '--output', default='project_index.html', help='Output HTML file')
+    parser.add_argument('-g', '--generate-readmes', action='store_true', help='Generate READMEs for projects that need them')
+    parser.add_argument('-i', '--generate-gitignore', action='store_true', help='Generate language-specific .gitignore files')
+    parser.add_argument('--preview-gitignore', action='store_true',
+                        help='Report what the .gitignore template would exclude, without writing it')
+    parser.add_argument('-r', '--init-repos', action='store_true', help='Initialize git repositories for projects')
+    parser.add_argument('-G', '--github', action='store_true', help='Create GitHub repositories for projects')
+    parser.add_argument('-p', '--private', action='store_true', help='Make GitHub repositories private (default: public)')
+    parser.add_argument('--github-concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'Parallel GitHub API requests (default: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('-f', '--filter', nargs='+', help='Filter for GitHub repo creation (e.g., Python JavaScript)')
+    parser.add_argument('-j', '--json', help='Also write a machine-readable JSON index to this file')
+    parser.add_argument('--cache', default='.codedoc-cache.json', help='Scan cache file (default: .codedoc-cache.json)')
+    parser.add_argument('--no-cache', action='store_true', help='Do not read or write the scan cache')
+    parser.add_argument('--no-git-metrics', action='store_true', help='Skip collecting commit activity metrics')
+    parser.add_argument('--search-index', nargs='?', const=DEFAULT_SEARCH_INDEX,
+                        help=f'Index READMEs for full-text search (default file: {DEFAULT_SEARCH_INDEX})')
+    parser.add_argument('--deps-index', nargs='?', const=DEFAULT_DEPS_INDEX,
+                        help=f'Write the dependency-to-projects index (default file: {DEFAULT_DEPS_INDEX})')
+    parser.add_argument('--checkpoint', nargs='?', const=DEFAULT_CHECKPOINT,
+                        help=f'Journal completed projects so an interrupted run can resume (default file: {DEFAULT_CHECKPOINT})')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip projects completed in the checkpoint journal and rebuild outputs from it')
+    parser.add_argument('--restart', action='store_true',
+                        help='Discard an existing checkpoint journal instead of refusing to overwrite it')
+    parser.add_argument('--progress', action='store_true', help='Log progress, throughput and ETA periodically')
+    parser.add_argument('--events', help='Stream progress events as newline-delimited JSON to this file or FIFO')
+    parser.add_argument('--prometheus-textfile', help='Keep scan metrics in this Prometheus textfile')
+    parser.add_argument('--max-file-size', type=float, default=DEFAULT_MAX_FILE_SIZE / (1024 * 1024),
+                        help='Warn about files larger than this many MB (default: 100)')
+    parser.add_argument('--skip-large', action='store_true',
+                        help='Skip git initialization and GitHub creation for projects with oversized files not excluded by .gitignore')
+    
+    # Parse arguments
+    args = parser.parse_args(argv)
+    
+    # Ensure output has HTML extension
+    if not args.output.lower().endswith('.html'):
+        args.output += '.html'
+    
+    # Progress messages go to the console
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
+    # Print settings
+    logger.info(f"Scanning projects in {args.directory}")
+    logger.info(f"README generation is {'enabled' if args.generate_readmes else 'disabled'}")
+    logger.info(f".gitignore generation is {'enabled' if args.generate_gitignore else 'disabled'}")
+    logger.info(f"Git repo initialization is {'enabled' if args.init_repos else 'disabled'}")
+    logger.info(f"GitHub repo creation is {'enabled' if args.github else 'disabled'}")
+    if args.github and args.filter:
+        logger.info(f"GitHub creation filter: {', '.join(args.filter)}")
+    
+    # Load scan cache
+    cache = MemoryCache() if args.no_cache else JsonFileCache(args.cache)
+    
+    # Open README search index if requested
+    search_index = ReadmeIndex(args.search_index) if args.search_index else None
+    
+    # Open checkpoint journal; resuming keeps the records already in it
+    if args.resume and not args.checkpoint:
+        args.checkpoint = DEFAULT_CHECKPOINT
+    # Search index changes are committed whenever the journal syncs, so journaled projects stay searchable
+    journal = None
+    if args.checkpoint:
+        try:
+            journal = CheckpointJournal(args.checkpoint, resume=args.resume, overwrite=args.restart,
+                                        before_sync=search_index.save if search_index is not None else None)
+        except FileExistsError:
+            sys.exit(f"Checkpoint journal {args.checkpoint} holds an unfinished run; "
+                     f"pass --resume to continue it or --restart to discard it")
+    completed = journal.completed if journal else None
+    if completed:
+        logger.info(f"Resuming: {len(completed)} projects already completed")
+    
+    # Start progress telemetry if requested
+    reporter = None
+    if args.progress or args.events or args.prometheus_textfile:
+        reporter = ProgressReporter(args.events, args.prometheus_textfile, args.progress)
+    
+    # Find all projects
+    projects = []
+    github_candidates = []
+    
+    # The journal, telemetry, cache and search index are closed even if the scan is interrupted,
+    # so work done so far is kept
+    try:
+        for project_info in iter_projects(args.directory, args.generate_readmes, args.generate_gitignore,
+                                          args.init_repos, not args.no_git_metrics, cache,
+                                          max_file_size=int(args.max_file_size * 1024 * 1024),
+                                          skip_large=args.skip_large,
+                                          preview_gitignore=args.preview_gitignore,
+                                          search_index=search_index,
+                                          completed=completed,
+                                          on_event=reporter.on_event if reporter else None):
+            projects.append(project_info)
+        
+            # Checkpoint newly scanned projects
+            if journal and not (completed and os.path.abspath(project_info['path']) in completed):
+                journal.append(project_info)
+        
+            # Create GitHub repo if requested and matches filter
+            if args.github:
+                should_create = True
+                if args.filter:
+                    # Check if language or project type matches filter
+                    language_match = project_info['language'] in args.filter
+                    type_match = any(f in project_info['type'] for f in args.filter)
+                    should_create = language_match or type_match
+            
+                # Oversized files would be rejected by the push
+                if args.skip_large and project_info['size']['oversized']:
+                    should_create = False
+            
+                if should_create:
+                    github_candidates.append(project_info)
+        
+        # Drop projects that no longer exist from the search index, once the scan is complete
+        if search_index is not None:
+            search_index.prune([args.directory], [p['path'] for p in projects])
+    finally:
+        if journal:
+            journal.close()
+        if reporter:
+            reporter.close()
+        cache.save()
+        if search_index is not None:
+            search_index.close()
+    
+    logger.info(f"Found {len(projects)} projects")
+    
+    # Create GitHub repos in one batch over a shared API client
+    if github_candidates:
+        created = create_github_repos(github_candidates, args.private, concurrency=args.github_concurrency)
+        logger.info(f"Created {len(created)} GitHub repositories")
+    
+    # Create HTML index
+    row_cache_file = None
+    if not args.no_cache:
+        output_dir, output_name = os.path.split(args.output)
+        row_cache_file = os.path.join(output_dir, f'.{output_name}.rows')
+    create_html_index(projects, args.output, row_cache_file)
+    
+    # Create JSON index if requested
+    if args.json:
+        create_json_index(projects, args.json)
+    
+    # Create dependency index if requested
+    if args.deps_index:
+        save_dependency_index(build_dependency_index(projects), args.deps_index)
+    
+    # The run is complete; its journal must not be resumed from later
+    if journal:
+        journal.discard()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,319 @@
+"""
+GitHub REST API client for creating repositories in bulk
+
+One client serves a whole run: HTTP connections are pooled and kept
+alive, concurrency is bounded by the pool size, and requests back off
+when GitHub reports a rate limit. Existing repositories are fetched once
+with a paginated listing instead of probing each project.
+"""
+
+import os
+import re
+import json
+import base64
+import time
+import queue
+import logging
+import threading
+import subprocess
+import http.client
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from .git import find_git_dir, read_git_remote, push_new_remote
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_URL = 'https://api.github.com'
+
+# Parallel API requests, and connections kept open for reuse
+DEFAULT_CONCURRENCY = 4
+
+# Retries for rate-limited, server-error and dropped-connection responses
+MAX_RETRIES = 5
+
+# Longest single wait for a rate limit to reset, in seconds
+MAX_RATE_LIMIT_WAIT = 15 * 60
+
+# Methods that may be resent after a server error or a dropped response;
+# a POST may already have taken effect, so it is only resent when GitHub
+# rejected it outright (rate limits) or it never reached the server
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'PUT', 'DELETE'}
+
+class GitHubError(Exception):
+    """An API request failed."""
+
+    def __init__(self, status, message):
+        super().__init__(f"GitHub API error {status}: {message}")
+        self.status = status
+        self.message = message
+
+def get_token():
+    """Find an API token in GITHUB_TOKEN/GH_TOKEN, falling back to the gh CLI's stored login."""
+    token = os.environ.get('GITHUB_TOKEN') or os.environ.get('GH_TOKEN')
+    if token:
+        return token
+    try:
+        result = subprocess.run(['gh', 'auth', 'token'], capture_output=True, text=True)
+    except OSError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+def get_git_protocol(host='github.com'):
+    """Return the git protocol ('ssh' or 'https') configured in the gh CLI for a host."""
+    try:
+        result = subprocess.run(['gh', 'config', 'get', 'git_protocol', '-h', host], capture_output=True, text=True)
+    except OSError:
+        return 'https'
+    protocol = result.stdout.strip() if result.returncode == 0 else ''
+    return protocol if protocol in ('ssh', 'https') else 'https'
+
+def push_settings(repo, protocol, token=None):
+    """Return (remote URL, git config for the push) for a newly created repository.
+
+    SSH pushes use the repository's ssh_url. HTTPS pushes send the API token as an
+    Authorization header scoped to the repository's host, so pushing needs no
+    credential helper and the token is never stored in the remote URL.
+    """
+    if protocol == 'ssh':
+        return repo['ssh_url'], None
+    url = repo['clone_url']
+    if not token:
+        return url, None
+    parts = urllib.parse.urlsplit(url)
+    credentials = base64.b64encode(f'x-access-token:{token}'.encode('utf-8')).decode('ascii')
+    return url, {f'http.{parts.scheme}://{parts.netloc}/.extraheader': f'Authorization: Basic {credentials}'}
+
+class GitHubClient:
+    """Minimal GitHub REST client with keep-alive connections and rate-limit backoff."""
+
+    def __init__(self, token=None, api_url=None, concurrency=DEFAULT_CONCURRENCY, timeout=30):
+        self.token = token
+        url = urllib.parse.urlsplit(api_url or os.environ.get('GITHUB_API_URL') or DEFAULT_API_URL)
+        self.scheme = url.scheme
+        self.host = url.netloc
+        self.base_path = url.path.rstrip('/')
+        self.timeout = timeout
+        self._pool = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(concurrency)
+        self._lock = threading.Lock()
+        self._resume_at = 0
+        self._login = None
+
+    def _connect(self):
+        conn_class = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+        return conn_class(self.host, timeout=self.timeout)
+
+    def _wait_for_rate_limit(self):
+        """Hold requests back while a known rate limit window is exhausted."""
+        with self._lock:
+            delay = self._resume_at - time.time()
+        if delay > 0:
+            logger.info(f"  GitHub rate limit reached, waiting {delay:.0f}s")
+            time.sleep(min(delay, MAX_RATE_LIMIT_WAIT))
+
+    def _note_rate_limit(self, headers):
+        """Remember when requests may resume if the rate limit is exhausted."""
+        if headers.get('X-RateLimit-Remaining') == '0' and headers.get('X-RateLimit-Reset', '').isdigit():
+            with self._lock:
+                self._resume_at = max(self._resume_at, int(headers['X-RateLimit-Reset']) + 1)
+
+    def request(self, method, path, body=None):
+        """Send a request and return (status, headers, decoded JSON body)."""
+        if path.startswith(('http://', 'https://')):
+            url = urllib.parse.urlsplit(path)
+            path = url.path + ('?' + url.query if url.query else '')
+        else:
+            path = self.base_path + path
+
+        headers = {
+            'Accept': 'application/vnd.github+json',
+            'User-Agent': 'codedoc',
+            'X-GitHub-Api-Version': '2022-11-28'
+        }
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+
+        idempotent = method in IDEMPOTENT_METHODS
+        for attempt in range(MAX_RETRIES + 1):
+            self._wait_for_rate_limit()
+            self._slots.acquire()
+            sent = False
+            try:
+                try:
+                    conn = self._pool.get_nowait()
+                except queue.Empty:
+                    conn = self._connect()
+                try:
+                    conn.request(method, path, body=payload, headers=headers)
+                    sent = True
+                    response = conn.getresponse()
+                    # The body must be read fully before the connection can be reused
+                    data = response.read()
+                except (http.client.HTTPException, OSError) as e:
+                    conn.close()
+                    if attempt == MAX_RETRIES or (sent and not idempotent):
+                        raise GitHubError(0, str(e))
+                    error = e
+                else:
+                    error = None
+                    if response.will_close:
+                        conn.close()
+                    else:
+                        self._pool.put(conn)
+            finally:
+                self._slots.release()
+
+            if error is not None:
+                logger.debug(f"  GitHub connection failed ({error}), retrying")
+                time.sleep(2 ** attempt)
+                continue
+
+            status = response.status
+            response_headers = response.headers
+            self._note_rate_limit(response_headers)
+
+            # Primary and secondary rate limits: wait and retry
+            retry_after = response_headers.get('Retry-After')
+            rate_limited = status == 429 or (status == 403 and (
+                retry_after or response_headers.get('X-RateLimit-Remaining') == '0'))
+            if (rate_limited or (status >= 500 and idempotent)) and attempt < MAX_RETRIES:
+                if retry_after and retry_after.isdigit():
+                    time.sleep(min(int(retry_after), MAX_RATE_LIMIT_WAIT))
+                elif not rate_limited or response_headers.get('X-RateLimit-Remaining') != '0':
+                    time.sleep(2 ** attempt)
+                continue
+
+            try:
+                decoded = json.loads(data) if data else None
+            except ValueError:
+                decoded = None
+            return status, response_headers, decoded
+
+        raise GitHubError(0, 'retries exhausted')
+
+    def list_repo_names(self):
+        """Return the lowercased names of all repositories owned by the authenticated user."""
+        names = set()
+        path = '/user/repos?per_page=100&affiliation=owner'
+        while path:
+            status, headers, data = self.request('GET', path)
+            if status != 200:
+                raise GitHubError(status, (data or {}).get('message', 'could not list repositories'))
+            names.update(repo['name'].lower() for repo in data)
+            next_link = re.search(r'<([^>]+)>;\s*rel="next"', headers.get('Link', ''))
+            path = next_link.group(1) if next_link else None
+        return names
+
+    def get_login(self):
+        """Return the authenticated user's login."""
+        if self._login is None:
+            status, _, data = self.request('GET', '/user')
+            if status != 200:
+                raise GitHubError(status, (data or {}).get('message', 'could not read the authenticated user'))
+            self._login = data['login']
+        return self._login
+
+    def get_repo(self, owner, name):
+        """Return a repository's API record, or None if it does not exist."""
+        path = f"/repos/{urllib.parse.quote(owner)}/{urllib.parse.quote(name)}"
+        status, _, data = self.request('GET', path)
+        if status == 404:
+            return None
+        if status != 200:
+            raise GitHubError(status, (data or {}).get('message', 'could not read repository'))
+        return data
+
+    def create_repo(self, name, private=False):
+        """Create a repository for the authenticated user and return its API record.
+
+        The POST is not resent blindly: when its outcome is unknown (a server
+        error or a connection dropped after the request was sent), the
+        repository is looked up first, so a creation that did go through is
+        returned rather than retried into a 422 'name already exists'.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                status, _, data = self.request('POST', '/user/repos', {'name': name, 'private': private})
+            except GitHubError as e:
+                status, error = e.status, e
+            else:
+                if status == 201:
+                    return data
+                error = GitHubError(status, (data or {}).get('message', 'could not create repository'))
+
+            if (status and status < 500) or attempt == MAX_RETRIES:
+                raise error
+            repo = self.get_repo(self.get_login(), name)
+            if repo is not None:
+                return repo
+            time.sleep(2 ** attempt)
+        raise error
+
+    def close(self):
+        """Close pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+def create_github_repos(projects, private=False, client=None, concurrency=DEFAULT_CONCURRENCY):
+    """Create GitHub repositories for project records and push their current branch.
+
+    Returns the names of the repositories created.
+    """
+    own_client = client is None
+    if own_client:
+        client = GitHubClient(get_token(), concurrency=concurrency)
+
+    try:
+        existing = client.list_repo_names()
+    except GitHubError as e:
+        logger.error(f"  Could not list GitHub repositories: {e}")
+        if own_client:
+            client.close()
+        return []
+
+    # Push over the protocol the user set up with gh; its host is the API host, minus the api. prefix
+    host = client.host.split(':')[0]
+    protocol = get_git_protocol('github.com' if host == 'api.github.com' else host)
+
+    pending = []
+    for project in projects:
+        project_name = project['name']
+        if not find_git_dir(project['path']):
+            logger.info(f"  Skipping GitHub repo creation for {project_name} - not a git repository")
+        elif project_name.lower() in existing:
+            logger.info(f"  GitHub repository already exists for {project_name}")
+        elif read_git_remote(project['path']):
+            logger.info(f"  Remote already exists for {project_name}")
+        else:
+            pending.append(project)
+
+    def create_one(project):
+        project_name = project['name']
+        try:
+            repo = client.create_repo(project_name, private)
+        except GitHubError as e:
+            logger.warning(f"  Failed to create GitHub repo for {project_name}: {e}")
+            return None
+        logger.info(f"  Created GitHub repository for {project_name}")
+        url, config = push_settings(repo, protocol, client.token)
+        if not push_new_remote(project['path'], url, config=config):
+            logger.warning(f"  Failed to push {project_name} to {url}")
+        return repo['name']
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            created = [name for name in executor.map(create_one, pending) if name]
+    finally:
+        if own_client:
+            client.close()
+    return created
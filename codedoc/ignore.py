@@ -0,0 +1,302 @@
+"""
+Compiled .gitignore matching and dry-run previews of generated templates
+
+Patterns are sorted into fast lookup tables instead of being matched one
+by one: literal basenames go in a hash, '*suffix' patterns (extensions and
+the like) in a hash keyed by suffix, and anchored literal paths in a
+directory-prefix trie that the walk descends alongside the filesystem.
+Only patterns with other wildcards fall back to regular expressions.
+
+As in git, the last matching pattern wins and nothing inside an excluded
+directory can be re-included. Nested .gitignore files are not read.
+"""
+
+import os
+import re
+import heapq
+import subprocess
+
+# Number of example paths kept in a preview report
+PREVIEW_SAMPLE = 10
+
+_WILDCARD_CHARS = set('*?[\\')
+
+# Trie key for 'dir/**' rules, which apply below a directory; path components never contain '/'
+DESCENDANTS = '/**'
+
+def _has_wildcard(text):
+    return any(c in _WILDCARD_CHARS for c in text)
+
+def _glob_to_regex(pattern):
+    """Translate a gitignore glob to a regular expression matching a whole path."""
+    parts = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**/', i) and (i == 0 or pattern[i - 1] == '/'):
+            parts.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('/**', i) and i + 3 == n:
+            parts.append('/.*')
+            i += 3
+        elif c == '*':
+            parts.append('[^/]*')
+            i += 1
+        elif c == '?':
+            parts.append('[^/]')
+            i += 1
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            if end == -1:
+                parts.append(re.escape(c))
+                i += 1
+                continue
+            body = pattern[i + 1:end]
+            if body[0] in '!^':
+                body = '^' + body[1:]
+            parts.append('[' + body.replace('\\', '\\\\') + ']')
+            i = end + 1
+        elif c == '\\' and i + 1 < n:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(c))
+            i += 1
+    return ''.join(parts)
+
+class IgnoreMatcher:
+    """A set of gitignore patterns compiled into lookup tables."""
+
+    def __init__(self, text=''):
+        self.count = 0
+        self.names = {}
+        self.suffixes = {}
+        self.suffix_lengths = []
+        self.trie = {}
+        self.name_regexes = []
+        self.path_regexes = []
+        self._name_any = None
+        self._path_any = None
+        self.add(text)
+
+    def add(self, text):
+        """Compile more patterns; later patterns take precedence over earlier ones."""
+        for line in text.splitlines():
+            self._add_pattern(line)
+
+        lengths = {len(suffix) for suffix in self.suffixes}
+        self.suffix_lengths = sorted(lengths)
+        # Combined expressions reject non-matching paths with a single regex call
+        self._name_any = re.compile('|'.join(r.pattern for _, r in self.name_regexes)) if self.name_regexes else None
+        self._path_any = re.compile('|'.join(r.pattern for _, r in self.path_regexes)) if self.path_regexes else None
+
+    def _add_pattern(self, line):
+        line = line.rstrip('\n')
+        # Trailing spaces are ignored unless escaped
+        if not line.endswith('\\ '):
+            line = line.rstrip(' ')
+        if not line or line.startswith('#'):
+            return
+
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        elif line.startswith('\\!') or line.startswith('\\#'):
+            line = line[1:]
+
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            return
+
+        # A slash anywhere but the end anchors the pattern to the project root
+        anchored = '/' in line
+        if line.startswith('**/') and '/' not in line[3:]:
+            line = line[3:]
+            anchored = False
+        line = line.lstrip('/')
+
+        self.count += 1
+        rule = (self.count, negate, dir_only)
+
+        if not anchored:
+            if not _has_wildcard(line):
+                self.names.setdefault(line, []).append(rule)
+            elif line.startswith('*') and not _has_wildcard(line[1:]) and line[1:]:
+                self.suffixes.setdefault(line[1:], []).append(rule)
+            else:
+                self.name_regexes.append((rule, re.compile(f'(?:{_glob_to_regex(line)})\\Z')))
+        elif not _has_wildcard(line):
+            node = self.trie
+            for component in line.split('/'):
+                node = node.setdefault(component, {})
+            node.setdefault(None, []).append(rule)
+        elif line.endswith('/**') and not _has_wildcard(line[:-3]):
+            # Everything inside a literal directory, but not the directory itself,
+            # so later negations can re-include entries below it
+            node = self.trie
+            for component in line[:-3].split('/'):
+                node = node.setdefault(component, {})
+            node.setdefault(DESCENDANTS, []).append(rule)
+        else:
+            self.path_regexes.append((rule, re.compile(f'(?:{_glob_to_regex(line)})\\Z')))
+
+    def _decide(self, rel_path, name, is_dir, trie_node, inherited=()):
+        """Return True if ignored, False if re-included, None if no pattern matches this entry.
+
+        inherited holds the 'dir/**' rules of the entry's ancestor directories.
+        """
+        best = None
+
+        def consider(rules):
+            nonlocal best
+            for rule in rules:
+                if (not rule[2] or is_dir) and (best is None or rule[0] > best[0]):
+                    best = rule
+
+        rules = self.names.get(name)
+        if rules:
+            consider(rules)
+        for length in self.suffix_lengths:
+            if length > len(name):
+                break
+            rules = self.suffixes.get(name[-length:])
+            if rules:
+                consider(rules)
+        if trie_node and None in trie_node:
+            consider(trie_node[None])
+        if inherited:
+            consider(inherited)
+        if self._name_any is not None and self._name_any.match(name):
+            consider(rule for rule, regex in self.name_regexes if regex.match(name))
+        if self._path_any is not None and self._path_any.match(rel_path):
+            consider(rule for rule, regex in self.path_regexes if regex.match(rel_path))
+
+        if best is None:
+            return None
+        return not best[1]
+
+    def is_ignored(self, rel_path, is_dir=False):
+        """Check a '/'-separated path relative to the project root, including its parent directories."""
+        components = rel_path.strip('/').split('/')
+        node = self.trie
+        inherited = []
+        for depth, name in enumerate(components):
+            if node and DESCENDANTS in node:
+                inherited = inherited + node[DESCENDANTS]
+            node = node.get(name) if node else None
+            last = depth == len(components) - 1
+            decision = self._decide('/'.join(components[:depth + 1]), name, is_dir or not last, node, inherited)
+            if decision and not last:
+                return True
+            if last:
+                return bool(decision)
+        return False
+
+def read_tracked_files(project_path):
+    """Return the set of files tracked by git, or an empty set outside a repository."""
+    if not os.path.exists(os.path.join(project_path, '.git')):
+        return set()
+    try:
+        result = subprocess.run(['git', 'ls-files', '-z'], cwd=project_path, capture_output=True)
+    except OSError:
+        return set()
+    if result.returncode != 0:
+        return set()
+    return {path for path in result.stdout.decode('utf-8', errors='replace').split('\0') if path}
+
+def load_gitignore(project_path, template=''):
+    """Compile a project's root .gitignore, followed by template when given."""
+    matcher = IgnoreMatcher()
+    try:
+        with open(os.path.join(project_path, '.gitignore'), 'r', encoding='utf-8', errors='ignore') as f:
+            matcher.add(f.read())
+    except OSError:
+        pass
+    if template:
+        matcher.add(template)
+    return matcher
+
+def split_ignored(project_path, rel_paths):
+    """Split '/'-separated paths into (committed, ignored) by the project's root .gitignore.
+
+    Files git already tracks stay committed even when a pattern matches them.
+    """
+    matcher = load_gitignore(project_path)
+    if not matcher.count:
+        return list(rel_paths), []
+    tracked = read_tracked_files(project_path)
+    committed = []
+    ignored = []
+    for rel_path in rel_paths:
+        if rel_path in tracked or not matcher.is_ignored(rel_path):
+            committed.append(rel_path)
+        else:
+            ignored.append(rel_path)
+    return committed, ignored
+
+def preview_gitignore(project_path, template):
+    """Report what a .gitignore template, merged with any existing .gitignore, would exclude.
+
+    Returns counts and bytes of excluded files, the largest excluded files, and the
+    tracked files that would become ignored. Nothing is written.
+    """
+    matcher = load_gitignore(project_path, template)
+
+    excluded_files = 0
+    excluded_bytes = 0
+    excluded_dirs = 0
+    largest = []
+
+    def record(rel_path, size):
+        nonlocal excluded_files, excluded_bytes
+        excluded_files += 1
+        excluded_bytes += size
+        if len(largest) < PREVIEW_SAMPLE:
+            heapq.heappush(largest, (size, rel_path))
+        elif size > largest[0][0]:
+            heapq.heapreplace(largest, (size, rel_path))
+
+    # Each stack entry carries the trie node for its directory, the 'dir/**' rules
+    # inherited from its ancestors, and whether the directory is already excluded
+    # so its contents are only sized
+    stack = [(project_path, '', matcher.trie, (), False)]
+    while stack:
+        directory, rel_dir, trie_node, inherited, excluded = stack.pop()
+        if trie_node and DESCENDANTS in trie_node:
+            inherited = inherited + tuple(trie_node[DESCENDANTS])
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                rel_path = rel_dir + name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    if is_dir and name == '.git' and not rel_dir:
+                        continue
+                    child_node = trie_node.get(name) if trie_node else None
+                    ignored = excluded or bool(matcher._decide(rel_path, name, is_dir, child_node, inherited))
+                    if is_dir:
+                        if ignored and not excluded:
+                            excluded_dirs += 1
+                        stack.append((entry.path, rel_path + '/', child_node, inherited, ignored))
+                    elif ignored and entry.is_file(follow_symlinks=False):
+                        record(rel_path, entry.stat(follow_symlinks=False).st_size)
+                except OSError:
+                    continue
+
+    tracked_ignored = sorted(path for path in read_tracked_files(project_path) if matcher.is_ignored(path))
+
+    return {
+        'patterns': matcher.count,
+        'excluded_files': excluded_files,
+        'excluded_bytes': excluded_bytes,
+        'excluded_dirs': excluded_dirs,
+        'largest': [{'path': path, 'bytes': size} for size, path in sorted(largest, reverse=True)],
+        'tracked_ignored': len(tracked_ignored),
+        'tracked_ignored_sample': tracked_ignored[:PREVIEW_SAMPLE]
+    }
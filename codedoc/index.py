@@ -0,0 +1,284 @@
+"""
+HTML and JSON project index output
+"""
+
+import os
+import datetime
+import json
+import logging
+import tempfile
+
+from .git import ACTIVE_AUTHOR_DAYS
+from .sizes import format_size
+
+logger = logging.getLogger(__name__)
+
+def html_escape(text):
+    """Escape text for inclusion in HTML."""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+# Bump when render_row output changes so cached fragments are discarded
+ROW_CACHE_VERSION = 1
+
+def render_row(project):
+    """Render the table row for one project."""
+    git_metrics = project.get('git') or {}
+    size_info = project.get('size') or {}
+    path = os.path.relpath(project['path'])
+    
+    # Handle description
+    desc = html_escape(project['description'])
+    desc = desc.replace('\n', '<br>')
+    
+    parts = []
+    parts.append('        <tr>\n')
+    parts.append(f'            <td>{project["name"]}</td>\n')
+    parts.append(f'            <td>{project["type"]}</td>\n')
+    parts.append(f'            <td>{project["language"]}</td>\n')
+    parts.append(f'            <td>{project["status"]}</td>\n')
+    parts.append(f'            <td>{project["last_modified"]}</td>\n')
+    parts.append(f'            <td>{path}</td>\n')
+    parts.append(f'            <td class="description">{desc}</td>\n')
+    
+    # Git metrics, blank when the project has no commits
+    parts.append(f'            <td>{git_metrics.get("commits", "")}</td>\n')
+    parts.append(f'            <td>{git_metrics.get("active_authors", "")}</td>\n')
+    parts.append(f'            <td>{git_metrics.get("first_commit", "")}</td>\n')
+    parts.append(f'            <td>{git_metrics.get("last_commit", "")}</td>\n')
+    parts.append(f'            <td>{git_metrics.get("churn", "")}</td>\n')
+    
+    # Size report: total, binary blobs and files too large to push
+    size_cell = ''
+    if size_info.get('total_bytes') is not None:
+        size_cell = f'{format_size(size_info["total_bytes"])} ({size_info["file_count"]} files'
+        if size_info.get('binary_count'):
+            size_cell += f', {size_info["binary_count"]} binary'
+        size_cell += ')'
+        if size_info.get('largest'):
+            largest = size_info['largest'][0]
+            size_cell += f'<br>Largest: {html_escape(largest["path"])} ({format_size(largest["bytes"])})'
+        if size_info.get('oversized'):
+            size_cell += f'<br><strong>{len(size_info["oversized"])} oversized file(s)</strong>'
+    parts.append(f'            <td>{size_cell}</td>\n')
+    parts.append('        </tr>\n')
+    return ''.join(parts)
+
+class RowCache:
+    """Rendered table rows, reused while a project's scan fingerprint is unchanged.
+    
+    Fragments are appended as raw bytes to <base>.frag; <base>.idx is an
+    append-only log of NUL-separated (path, fingerprint, offset, length)
+    entries in which later entries win. A run with a few changed projects
+    appends their rows and index entries, and unchanged rows are copied into
+    the output by offset without being decoded. Both files are compacted
+    once most of the fragment file is dead. A header on each file ties them
+    to one generation, and the index to the working directory, since rows
+    show locations relative to it.
+    """
+
+    def __init__(self, base_path):
+        self.frag_path = base_path + '.frag'
+        self.idx_path = base_path + '.idx'
+        self.cwd = os.getcwd()
+        self.generation = None
+        self.data = b''
+        self.entries = {}
+        self.logged = 0
+        self.torn = False
+        self.used = {}
+        self.new = []
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.idx_path, 'rb') as f:
+                index = f.read().decode('utf-8', 'surrogateescape')
+            with open(self.frag_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return
+        header, _, body = index.partition('\n')
+        frag_header = data[:data.find(b'\n')]
+        try:
+            header = json.loads(header)
+        except ValueError:
+            return
+        if (not isinstance(header, dict) or header.get('version') != ROW_CACHE_VERSION
+                or header.get('cwd') != self.cwd or frag_header.decode('ascii', 'replace') != header.get('generation')):
+            return
+        
+        fields = body.split('\0')
+        # A torn trailing entry is ignored, and the index rewritten before anything is appended after it
+        count = (len(fields) - 1) // 4
+        self.torn = len(fields) != count * 4 + 1 or fields[-1] != ''
+        entries = {}
+        for i in range(0, count * 4, 4):
+            entries[fields[i]] = (fields[i + 1], fields[i + 2], fields[i + 3])
+        self.generation = header['generation']
+        self.data = data
+        self.entries = entries
+        self.logged = count
+
+    def get(self, path, fingerprint):
+        """Return the cached row bytes for a project, or None."""
+        entry = self.entries.get(path)
+        if entry is None or entry[0] != fingerprint:
+            return None
+        offset, length = int(entry[1]), int(entry[2])
+        # Entries past the end of the fragments were logged before a crash lost their data
+        if offset + length > len(self.data):
+            return None
+        self.used[path] = entry
+        return self.data[offset:offset + length]
+
+    def put(self, path, fingerprint, row):
+        """Add a newly rendered row."""
+        self.new.append((path, fingerprint, row))
+
+    def save(self):
+        """Append new rows, or rewrite both files when the cache is mostly dead."""
+        if not self.new and not self.torn and len(self.used) == len(self.entries):
+            return
+        live_bytes = sum(int(entry[2]) for entry in self.used.values()) + sum(len(row) for _, _, row in self.new)
+        live_count = len(self.used) + len(self.new)
+        dead_bytes = len(self.data) - live_bytes
+        if self.generation is None or self.torn or dead_bytes > live_bytes or self.logged + len(self.new) > 2 * live_count:
+            self._compact()
+        elif self.new:
+            self._append()
+
+    def _append(self):
+        with open(self.frag_path, 'ab') as f:
+            offset = f.seek(0, os.SEEK_END)
+            entries = []
+            for path, fingerprint, row in self.new:
+                f.write(row)
+                entries.append(f'{path}\0{fingerprint}\0{offset}\0{len(row)}\0')
+                offset += len(row)
+            f.flush()
+            # Fragments reach the disk before the index entries that point at them
+            os.fsync(f.fileno())
+        with open(self.idx_path, 'ab') as f:
+            f.write(''.join(entries).encode('utf-8', 'surrogateescape'))
+
+    def _compact(self):
+        generation = os.urandom(8).hex()
+        pieces = [generation.encode('ascii') + b'\n']
+        entries = [json.dumps({'version': ROW_CACHE_VERSION, 'cwd': self.cwd, 'generation': generation}) + '\n']
+        offset = len(pieces[0])
+        for path, (fingerprint, old_offset, length) in self.used.items():
+            old_offset, length = int(old_offset), int(length)
+            pieces.append(self.data[old_offset:old_offset + length])
+            entries.append(f'{path}\0{fingerprint}\0{offset}\0{length}\0')
+            offset += length
+        for path, fingerprint, row in self.new:
+            pieces.append(row)
+            entries.append(f'{path}\0{fingerprint}\0{offset}\0{len(row)}\0')
+            offset += len(row)
+        write_atomic(self.frag_path, pieces)
+        write_atomic(self.idx_path, [''.join(entries).encode('utf-8', 'surrogateescape')])
+
+def write_atomic(output_file, pieces):
+    """Write byte pieces to a temp file beside output_file, then rename it into place."""
+    directory = os.path.dirname(os.path.abspath(output_file))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(output_file), suffix='.tmp')
+    try:
+        # mkstemp creates the file owner-only; keep the permissions of the file being replaced
+        try:
+            mode = os.stat(output_file).st_mode & 0o777
+        except OSError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        with os.fdopen(fd, 'wb') as f:
+            f.writelines(pieces)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def create_html_index(projects, output_file, row_cache_file=None):
+    """Create HTML index of projects.
+    
+    With row_cache_file, rendered rows are cached under each project's path and scan
+    fingerprint, and only new or changed projects are rendered again. The file is
+    replaced atomically.
+    """
+    row_cache = RowCache(row_cache_file) if row_cache_file else None
+    
+    pieces = []
+    
+    # HTML header
+    pieces.append('<!DOCTYPE html>\n')
+    pieces.append('<html>\n')
+    pieces.append('<head>\n')
+    pieces.append('    <meta charset="UTF-8">\n')
+    pieces.append('    <title>Code Projects Index</title>\n')
+    pieces.append('    <style>\n')
+    pieces.append('        body { font-family: Arial, sans-serif; margin: 20px; }\n')
+    pieces.append('        table { border-collapse: collapse; width: 100%; }\n')
+    pieces.append('        th { background-color: #4a86e8; color: white; font-weight: bold; text-align: left; padding: 8px; border: 1px solid #ddd; }\n')
+    pieces.append('        tr:nth-child(even) { background-color: #e6f0ff; } /* Light blue for even rows */\n')
+    pieces.append('        tr:nth-child(odd) { background-color: white; } /* White for odd rows */\n')
+    pieces.append('        td { padding: 8px; border: 1px solid #ddd; vertical-align: top; }\n')
+    pieces.append('        td.description { word-wrap: break-word; max-width: 500px; }\n')
+    pieces.append('    </style>\n')
+    pieces.append('</head>\n')
+    pieces.append('<body>\n')
+    pieces.append('    <h1>Code Projects Index</h1>\n')
+    pieces.append(f'    <p>Contains information about {len(projects)} projects.</p>\n')
+    
+    # Start table
+    pieces.append('    <table>\n')
+    pieces.append('        <tr>\n')
+    pieces.append('            <th>Project Name</th>\n')
+    pieces.append('            <th>Type</th>\n')
+    pieces.append('            <th>Language</th>\n')
+    pieces.append('            <th>Status</th>\n')
+    pieces.append('            <th>Last Updated</th>\n')
+    pieces.append('            <th>Location</th>\n')
+    pieces.append('            <th>Description</th>\n')
+    pieces.append('            <th>Commits</th>\n')
+    pieces.append(f'            <th>Active Authors ({ACTIVE_AUTHOR_DAYS}d)</th>\n')
+    pieces.append('            <th>First Commit</th>\n')
+    pieces.append('            <th>Last Commit</th>\n')
+    pieces.append('            <th>Churn</th>\n')
+    pieces.append('            <th>Size</th>\n')
+    pieces.append('        </tr>\n')
+    
+    # Project rows as bytes, copying cached fragments for unchanged records
+    chunks = [''.join(pieces).encode('utf-8')]
+    for project in sorted(projects, key=lambda p: p['name'].lower()):
+        fingerprint = project.get('fingerprint')
+        row = row_cache.get(project['path'], fingerprint) if row_cache and fingerprint else None
+        if row is None:
+            row = render_row(project).encode('utf-8', 'replace')
+            if row_cache and fingerprint:
+                row_cache.put(project['path'], fingerprint, row)
+        chunks.append(row)
+    
+    # Close table and HTML
+    pieces = []
+    pieces.append('    </table>\n')
+    pieces.append(f'    <p><em>Last updated: {datetime.datetime.now().strftime("%Y-%m-%d")}</em></p>\n')
+    pieces.append('</body>\n')
+    pieces.append('</html>')
+    chunks.append(''.join(pieces).encode('utf-8'))
+    
+    write_atomic(output_file, chunks)
+    
+    if row_cache:
+        row_cache.save()
+    
+    logger.info(f"HTML index saved to {output_file}")
+
+def create_json_index(projects, output_file):
+    """Create a machine-readable JSON index of projects."""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(sorted(projects, key=lambda p: p['name'].lower()), f, indent=2)
+    
+    logger.info(f"JSON index saved to {output_file}")
@@ -0,0 +1,132 @@
+"""
+Language detection by file extension, with content sniffing for ambiguous extensions
+
+Extensions shared by several languages (.pl, .m, .v, .h) are resolved by
+reading the first few KB of a small sample of files and scoring them
+against precompiled patterns. Verdicts are memoized per file under
+(device, inode) and reused while the mtime and size match, so cached
+rescans do not read file contents.
+"""
+
+import re
+
+LANG_MAP = {
+    ".js": "JavaScript",
+    ".jsx": "JavaScript",
+    ".ts": "TypeScript",
+    ".tsx": "TypeScript",
+    ".py": "Python",
+    ".java": "Java",
+    ".kt": "Kotlin",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".html": "HTML",
+    ".css": "CSS",
+    ".sh": "Shell",
+    ".erl": "Erlang",
+    ".sql": "SQL",
+    ".sol": "Solidity",
+    ".scss": "SCSS",
+    ".swift": "Swift",
+    ".m": "Objective-C",
+    ".pl": "Perl",
+    ".pro": "Prolog",
+    ".P": "Prolog",
+    ".circom": "Circom",
+    ".vy": "Vyper",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".c": "C",
+    ".h": "C",
+    ".cpp": "C++",
+    ".hpp": "C++",
+    ".cs": "C#",
+    ".lua": "Lua",
+    ".r": "R",
+    ".scala": "Scala",
+    ".clj": "Clojure",
+    ".ex": "Elixir",
+    ".dart": "Dart",
+    ".nim": "Nim",
+    ".zig": "Zig",
+    ".v": "Verilog"
+}
+
+# Bytes read from the start of each sampled file
+SNIFF_BYTES = 4096
+
+# Files sampled per ambiguous extension in a project
+SNIFF_SAMPLE = 3
+
+# Ambiguous extension -> [(language, pattern)]; each pattern match scores one point.
+# LANG_MAP gives the answer when no pattern matches.
+AMBIGUOUS_EXTENSIONS = {
+    '.pl': [
+        ('Perl', re.compile(r'^#!.*\bperl\b|^\s*use\s+(?:strict|warnings|[A-Z]\w*(?:::\w+)*)\s*[;\s]|'
+                            r'\bmy\s+[$@%]\w+|^\s*sub\s+\w+\s*\{|\$_\b|=~\s*[sm]?/', re.MULTILINE)),
+        ('Prolog', re.compile(r'^\s*:-\s*\w+|^[a-z]\w*(?:\([^)]*\))?\s*:-|^[a-z]\w*\([^)]*\)\s*\.\s*$',
+                              re.MULTILINE)),
+    ],
+    '.m': [
+        ('Objective-C', re.compile(r'^\s*#\s*(?:import|include)\b|@(?:interface|implementation|end|property|'
+                                   r'synthesize|selector|protocol)\b|^\s*[-+]\s*\(\w+', re.MULTILINE)),
+        ('MATLAB', re.compile(r'^\s*function\s+(?:\[[^\]]*\]|\w+)\s*=|^\s*%|^\s*end\s*$|\b(?:disp|fprintf|zeros|'
+                              r'ones|plot|figure)\s*\(|;\s*%', re.MULTILINE)),
+    ],
+    '.v': [
+        ('Verilog', re.compile(r'\bmodule\s+\w+\s*(?:#\s*)?\(|\bendmodule\b|^\s*(?:always|assign|wire|reg|'
+                               r'input|output)\b|`(?:timescale|define|include)', re.MULTILINE)),
+        ('Coq', re.compile(r'^\s*(?:Theorem|Lemma|Proof|Qed|Definition|Fixpoint|Inductive|Require\s+Import)\b',
+                           re.MULTILINE)),
+        ('V', re.compile(r'^\s*(?:pub\s+)?fn\s+\w+\s*\(|^\s*module\s+\w+\s*$|^\s*import\s+[\w.]+\s*$|'
+                         r'\w+\s*:=\s*', re.MULTILINE)),
+    ],
+    '.h': [
+        ('C++', re.compile(r'^\s*(?:class|namespace)\s+\w+|\btemplate\s*<|\bstd::|^\s*(?:public|private|'
+                           r'protected)\s*:|\bvirtual\b', re.MULTILINE)),
+        ('Objective-C', re.compile(r'@(?:interface|protocol|end|property|class)\b|^\s*#\s*import\b',
+                                   re.MULTILINE)),
+    ],
+}
+
+def classify_file(path, ext):
+    """Return the best-scoring language for a file with an ambiguous extension, or None."""
+    try:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            head = f.read(SNIFF_BYTES)
+    except OSError:
+        return None
+
+    best, best_score = None, 0
+    for language, pattern in AMBIGUOUS_EXTENSIONS[ext]:
+        score = sum(1 for _ in pattern.finditer(head))
+        if score > best_score:
+            best, best_score = language, score
+    return best
+
+def resolve_languages(samples, cache=None):
+    """Map each ambiguous extension to a language by voting over sampled files.
+
+    samples maps extension -> [(path, stat_result)]. Verdicts per file are memoized
+    in cache under (device, inode), with the mtime and size they were made for, so
+    an edited file overwrites its entry instead of adding one.
+    """
+    resolved = {}
+    for ext, files in samples.items():
+        votes = {}
+        for path, st in files:
+            key = f"{st.st_dev}:{st.st_ino}"
+            entry = cache.get('language_sniff', key) if cache is not None else None
+            if (entry and entry.get('mtime_ns') == st.st_mtime_ns and entry.get('size') == st.st_size
+                    and entry.get('ext') == ext):
+                language = entry.get('language')
+            else:
+                language = classify_file(path, ext)
+                if cache is not None:
+                    cache.set('language_sniff', key, {'mtime_ns': st.st_mtime_ns, 'size': st.st_size,
+                                                      'ext': ext, 'language': language})
+            if language:
+                votes[language] = votes.get(language, 0) + 1
+        if votes:
+            resolved[ext] = max(votes, key=votes.get)
+    return resolved
@@ -0,0 +1,232 @@
+"""
+Dependency manifest parsing and the cross-project dependency index
+
+Declared dependencies are read from the manifests found at a project's
+root. Parsed results are cached per manifest by (mtime, size), and the
+reverse index maps 'ecosystem:name' to the projects that declare it.
+"""
+
+import os
+import re
+import json
+import logging
+import xml.etree.ElementTree as ET
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEPS_INDEX = 'dependency_index.json'
+
+def parse_package_json(text):
+    """Return {name: version} from package.json dependency sections."""
+    data = json.loads(text)
+    if not isinstance(data, dict):
+        return {}
+    deps = {}
+    for section in ['dependencies', 'devDependencies', 'peerDependencies', 'optionalDependencies']:
+        entries = data.get(section)
+        if isinstance(entries, dict):
+            for name, version in entries.items():
+                deps.setdefault(name, str(version))
+    return deps
+
+def parse_pom_xml(text):
+    """Return {groupId:artifactId: version} from a Maven pom, resolving simple ${property} references."""
+    root = ET.fromstring(text)
+    # Strip the POM namespace so tags can be matched by name
+    for element in root.iter():
+        if isinstance(element.tag, str) and '}' in element.tag:
+            element.tag = element.tag.split('}', 1)[1]
+
+    properties = {}
+    props = root.find('properties')
+    if props is not None:
+        for prop in props:
+            properties[prop.tag] = (prop.text or '').strip()
+    version = root.findtext('version') or root.findtext('parent/version')
+    if version:
+        properties.setdefault('project.version', version.strip())
+
+    def resolve(value):
+        return re.sub(r'\$\{([^}]+)\}', lambda m: properties.get(m.group(1), m.group(0)), value)
+
+    deps = {}
+    for dep in root.iter('dependency'):
+        group = (dep.findtext('groupId') or '').strip()
+        artifact = (dep.findtext('artifactId') or '').strip()
+        if not artifact:
+            continue
+        version = resolve((dep.findtext('version') or '').strip())
+        deps.setdefault(resolve(f"{group}:{artifact}"), version)
+    return deps
+
+def parse_go_mod(text):
+    """Return {module: version} from go.mod require directives."""
+    deps = {}
+    in_block = False
+    for line in text.splitlines():
+        line = line.split('//', 1)[0].strip()
+        if in_block:
+            if line == ')':
+                in_block = False
+                continue
+            parts = line.split()
+        elif line.startswith('require'):
+            rest = line[len('require'):].strip()
+            if rest == '(':
+                in_block = True
+                continue
+            parts = rest.split()
+        else:
+            continue
+        if len(parts) >= 2:
+            deps[parts[0]] = parts[1]
+    return deps
+
+def _cargo_dependency_tables(data):
+    """Yield every dependency table in parsed Cargo.toml data, including target-specific ones."""
+    for section in ['dependencies', 'dev-dependencies', 'build-dependencies']:
+        if isinstance(data.get(section), dict):
+            yield data[section]
+    targets = data.get('target')
+    if isinstance(targets, dict):
+        for target in targets.values():
+            if isinstance(target, dict):
+                yield from _cargo_dependency_tables(target)
+
+def _parse_cargo_toml_fallback(text):
+    """Minimal line-based reader for Cargo dependency tables when tomllib is unavailable."""
+    data = {}
+    table = None
+    for line in text.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        header = re.match(r'^\[([^\]]+)\]$', line)
+        if header:
+            name = header.group(1).strip()
+            table = data.setdefault('dependencies', {}) if re.search(r'(^|\.)(dev-|build-)?dependencies$', name) else None
+            continue
+        if table is None or '=' not in line:
+            continue
+        key, value = (part.strip() for part in line.split('=', 1))
+        version = re.search(r'version\s*=\s*"([^"]*)"', value) if value.startswith('{') else re.match(r'^"([^"]*)"', value)
+        table.setdefault(key.strip('"'), {'version': version.group(1) if version else ''})
+    return data
+
+def parse_cargo_toml(text):
+    """Return {crate: version} from Cargo.toml dependency tables."""
+    data = tomllib.loads(text) if tomllib else _parse_cargo_toml_fallback(text)
+    deps = {}
+    for table in _cargo_dependency_tables(data):
+        for name, spec in table.items():
+            if isinstance(spec, dict):
+                # Renamed dependencies name the real crate in 'package'
+                name = spec.get('package', name)
+                spec = spec.get('version', '')
+            deps.setdefault(name, str(spec))
+    return deps
+
+_REQUIREMENT = re.compile(r'^([A-Za-z0-9][A-Za-z0-9._-]*)\s*(?:\[[^\]]*\])?\s*([^;#]*)')
+
+def parse_requirements_txt(text):
+    """Return {normalized name: version specifier} from a pip requirements file."""
+    deps = {}
+    for line in text.splitlines():
+        line = line.split(' #', 1)[0].strip()
+        # Skip comments, options (-r, -e, --index-url) and direct URLs
+        if not line or line.startswith(('#', '-')) or '://' in line:
+            continue
+        match = _REQUIREMENT.match(line)
+        if match:
+            name = re.sub(r'[-_.]+', '-', match.group(1)).lower()
+            deps.setdefault(name, match.group(2).strip())
+    return deps
+
+# Manifest file name -> (ecosystem, parser)
+MANIFEST_PARSERS = {
+    'package.json': ('npm', parse_package_json),
+    'pom.xml': ('maven', parse_pom_xml),
+    'go.mod': ('go', parse_go_mod),
+    'Cargo.toml': ('cargo', parse_cargo_toml),
+    'requirements.txt': ('pypi', parse_requirements_txt)
+}
+
+def read_dependencies(project_path, cache=None):
+    """Return {ecosystem: {name: version}} for the manifests at a project's root.
+
+    Each manifest is parsed only when its (mtime, size) differs from the cached entry.
+    """
+    dependencies = {}
+    for filename, (ecosystem, parser) in MANIFEST_PARSERS.items():
+        manifest_path = os.path.join(project_path, filename)
+        try:
+            st = os.stat(manifest_path)
+        except OSError:
+            continue
+
+        key = os.path.abspath(manifest_path)
+        entry = cache.get('manifests', key) if cache is not None else None
+        if entry and entry['mtime_ns'] == st.st_mtime_ns and entry['size'] == st.st_size:
+            deps = entry['dependencies']
+        else:
+            try:
+                with open(manifest_path, 'r', encoding='utf-8', errors='replace') as f:
+                    deps = parser(f.read())
+            except OSError:
+                continue
+            except Exception as e:
+                # One malformed or unusual manifest must not stop the scan
+                logger.warning(f"  Could not parse {filename} in {os.path.basename(project_path)}: {e}")
+                deps = {}
+            if cache is not None:
+                cache.set('manifests', key, {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'dependencies': deps})
+
+        if deps:
+            dependencies.setdefault(ecosystem, {}).update(deps)
+    return dependencies
+
+def dependency_key(ecosystem, name):
+    """Key used in the dependency index."""
+    if ecosystem == 'pypi':
+        name = re.sub(r'[-_.]+', '-', name)
+    return f"{ecosystem}:{name.lower()}"
+
+def build_dependency_index(projects):
+    """Map 'ecosystem:name' to the projects that declare it, with the declared versions."""
+    index = {}
+    for project in sorted(projects, key=lambda p: p['name'].lower()):
+        for ecosystem, deps in (project.get('dependencies') or {}).items():
+            for name, version in deps.items():
+                index.setdefault(dependency_key(ecosystem, name), []).append({
+                    'project': project['name'],
+                    'path': project['path'],
+                    'version': version
+                })
+    return index
+
+def save_dependency_index(index, output_file):
+    """Write the dependency index to a JSON file."""
+    tmp_path = output_file + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f)
+    os.replace(tmp_path, output_file)
+    logger.info(f"Dependency index saved to {output_file}")
+
+def load_dependency_index(index_file):
+    """Read a dependency index written by save_dependency_index."""
+    with open(index_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def lookup_dependency(index, name):
+    """Return {key: users} for a dependency given as 'ecosystem:name' or a bare name in any ecosystem."""
+    if ':' in name and name.split(':', 1)[0] in {eco for eco, _ in MANIFEST_PARSERS.values()}:
+        ecosystem, name = name.split(':', 1)
+        keys = [dependency_key(ecosystem, name)]
+    else:
+        keys = [dependency_key(ecosystem, name) for ecosystem, _ in MANIFEST_PARSERS.values()]
+    return {key: index[key] for key in keys if key in index}
@@ -0,0 +1,204 @@
+"""
+Scan progress and throughput telemetry
+
+ProgressReporter consumes the events from iter_projects and derives
+projects/sec, files/sec, bytes/sec and an ETA from the discovered project
+count. Events go to a newline-delimited JSON file or FIFO, and metrics
+optionally to a Prometheus textfile, both written by a background thread:
+the scan only updates counters and enqueues, and drops events rather than
+wait if the writer falls behind.
+"""
+
+import os
+import json
+import time
+import queue
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between Prometheus textfile rewrites and console progress lines
+PROMETHEUS_INTERVAL = 5.0
+LOG_INTERVAL = 10.0
+
+# Events buffered for the writer before new ones are dropped
+QUEUE_SIZE = 10000
+
+_STOP = object()
+
+class ProgressReporter:
+    """Tracks scan throughput and publishes it without blocking the scan."""
+
+    def __init__(self, events_path=None, prometheus_path=None, log_progress=False):
+        self.events_path = events_path
+        self.prometheus_path = prometheus_path
+        self.log_progress = log_progress
+
+        self.total = 0
+        self.done = 0
+        self.resumed = 0
+        self.files = 0
+        self.bytes = 0
+        self.dropped = 0
+        self.started = time.time()
+        self._started_monotonic = time.monotonic()
+        self._last_log = self._started_monotonic
+
+        self._queue = queue.Queue(QUEUE_SIZE)
+        self._writer = None
+        if events_path or prometheus_path:
+            self._writer = threading.Thread(target=self._run_writer, name='codedoc-progress', daemon=True)
+            self._writer.start()
+
+    def snapshot(self):
+        """Current progress, rates and ETA."""
+        elapsed = max(time.monotonic() - self._started_monotonic, 1e-6)
+        scanned = self.done - self.resumed
+        projects_rate = scanned / elapsed
+        remaining = max(self.total - self.done, 0)
+        return {
+            'ts': time.time(),
+            'elapsed_seconds': round(elapsed, 3),
+            'projects_total': self.total,
+            'projects_done': self.done,
+            'projects_resumed': self.resumed,
+            'files': self.files,
+            'bytes': self.bytes,
+            'projects_per_sec': round(projects_rate, 3),
+            'files_per_sec': round(self.files / elapsed, 1),
+            'bytes_per_sec': round(self.bytes / elapsed, 1),
+            'eta_seconds': round(remaining / projects_rate, 1) if projects_rate else None,
+            'events_dropped': self.dropped
+        }
+
+    def on_event(self, name, data):
+        """Event callback for iter_projects."""
+        event = {'event': name}
+        if name == 'scan_start':
+            self.total = data['total']
+        elif name == 'project_start':
+            event['path'] = data['path']
+        elif name == 'project_done':
+            record = data['record']
+            self.done += 1
+            if data.get('resumed'):
+                self.resumed += 1
+            else:
+                size_info = record.get('size') or {}
+                self.files += size_info.get('file_count', 0)
+                self.bytes += size_info.get('total_bytes', 0)
+            event['project'] = record['name']
+            event['path'] = record['path']
+            event['resumed'] = bool(data.get('resumed'))
+
+        event.update(self.snapshot())
+        self._publish(event)
+
+        now = time.monotonic()
+        if self.log_progress and (name == 'scan_done' or now - self._last_log >= LOG_INTERVAL):
+            self._last_log = now
+            eta = event['eta_seconds']
+            logger.info(f"Progress: {self.done}/{self.total} projects, {event['projects_per_sec']:.2f} projects/s, "
+                        f"{event['files_per_sec']:.0f} files/s"
+                        + (f", ETA {eta:.0f}s" if eta is not None and name != 'scan_done' else ''))
+
+    def _publish(self, event):
+        if self._writer is None:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run_writer(self):
+        """Background loop writing queued events and refreshing the Prometheus textfile."""
+        events_file = None
+        if self.events_path:
+            try:
+                # Opening a FIFO waits for a reader; that wait happens here, not in the scan
+                events_file = open(self.events_path, 'a', encoding='utf-8')
+            except OSError as e:
+                logger.warning(f"Could not open progress event stream {self.events_path}: {e}")
+
+        latest = None
+        last_prometheus = 0.0
+        stopping = False
+        while not stopping:
+            try:
+                item = self._queue.get(timeout=PROMETHEUS_INTERVAL)
+            except queue.Empty:
+                item = None
+
+            # Drain whatever else is queued so each batch costs one flush
+            batch = [] if item is None else [item]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if _STOP in batch:
+                stopping = True
+                batch = [event for event in batch if event is not _STOP]
+
+            if batch:
+                latest = batch[-1]
+                if events_file:
+                    try:
+                        events_file.write(''.join(json.dumps(event) + '\n' for event in batch))
+                        events_file.flush()
+                    except OSError:
+                        # Reader went away (e.g. a closed FIFO); stop streaming events
+                        events_file = None
+
+            now = time.monotonic()
+            if self.prometheus_path and latest and (stopping or now - last_prometheus >= PROMETHEUS_INTERVAL):
+                last_prometheus = now
+                self._write_prometheus(latest)
+
+        if events_file:
+            try:
+                events_file.close()
+            except OSError:
+                pass
+
+    def _write_prometheus(self, snapshot):
+        """Replace the Prometheus textfile with the latest metrics."""
+        metrics = [
+            ('codedoc_scan_start_timestamp_seconds', 'gauge', 'Unix time the scan started', self.started),
+            ('codedoc_projects_discovered', 'gauge', 'Projects found to scan', snapshot['projects_total']),
+            ('codedoc_projects_done', 'gauge', 'Projects completed', snapshot['projects_done']),
+            ('codedoc_projects_resumed', 'gauge', 'Projects taken from a checkpoint', snapshot['projects_resumed']),
+            ('codedoc_files_scanned', 'gauge', 'Files walked', snapshot['files']),
+            ('codedoc_bytes_scanned', 'gauge', 'Bytes in files walked', snapshot['bytes']),
+            ('codedoc_projects_per_second', 'gauge', 'Project scan rate', snapshot['projects_per_sec']),
+            ('codedoc_files_per_second', 'gauge', 'File walk rate', snapshot['files_per_sec']),
+            ('codedoc_bytes_per_second', 'gauge', 'Byte walk rate', snapshot['bytes_per_sec']),
+            ('codedoc_eta_seconds', 'gauge', 'Estimated seconds remaining',
+             snapshot['eta_seconds'] if snapshot['eta_seconds'] is not None else 'NaN'),
+            ('codedoc_progress_events_dropped', 'gauge', 'Progress events dropped', snapshot['events_dropped'])
+        ]
+        lines = []
+        for name, metric_type, help_text, value in metrics:
+            lines.append(f'# HELP {name} {help_text}\n')
+            lines.append(f'# TYPE {name} {metric_type}\n')
+            lines.append(f'{name} {value}\n')
+
+        # Write then rename so the textfile collector never reads a partial file
+        tmp_path = f'{self.prometheus_path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines)
+            os.replace(tmp_path, self.prometheus_path)
+        except OSError as e:
+            logger.warning(f"Could not write Prometheus textfile {self.prometheus_path}: {e}")
+
+    def close(self, timeout=5.0):
+        """Flush outstanding telemetry and stop the writer."""
+        if self._writer is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            pass
+        self._writer.join(timeout)
@@ -0,0 +1,299 @@
+"""
+Project scanning: detection of type, language and description
+"""
+
+import os
+import glob
+import re
+import datetime
+import hashlib
+import logging
+
+from .generators import generate_readme, generate_gitignore, get_gitignore_template
+from .git import init_git_repo, get_git_metrics, read_git_head
+from .ignore import preview_gitignore, split_ignored
+from .languages import LANG_MAP, AMBIGUOUS_EXTENSIONS, SNIFF_SAMPLE, resolve_languages
+from .manifests import read_dependencies
+from .sizes import DEFAULT_MAX_FILE_SIZE, SizeReport, walk_files, format_size
+
+logger = logging.getLogger(__name__)
+
+def scan_project(project_path, generate_readme_flag=False, generate_gitignore_flag=False, init_git_flag=False,
+                 git_metrics_flag=True, cache=None, max_file_size=DEFAULT_MAX_FILE_SIZE, skip_large=False,
+                 preview_gitignore_flag=False, search_index=None, dependencies_flag=True):
+    """Analyze a single project directory."""
+    project_name = os.path.basename(project_path)
+    logger.info(f"Analyzing: {project_name}")
+    
+    # Detect project type
+    project_type = "Unknown"
+    if os.path.exists(os.path.join(project_path, "package.json")):
+        project_type = "JavaScript/Node.js"
+    elif os.path.exists(os.path.join(project_path, "pom.xml")):
+        project_type = "Java (Maven)"
+    elif os.path.exists(os.path.join(project_path, "build.gradle")):
+        project_type = "Java/Kotlin (Gradle)"
+    elif os.path.exists(os.path.join(project_path, "go.mod")):
+        project_type = "Go"
+    elif os.path.exists(os.path.join(project_path, "Cargo.toml")):
+        project_type = "Rust"
+    elif os.path.exists(os.path.join(project_path, "requirements.txt")) or glob.glob(os.path.join(project_path, "*.py")):
+        project_type = "Python" 
+    elif os.path.exists(os.path.join(project_path, "Dockerfile")):
+        project_type = "Docker"
+    elif glob.glob(os.path.join(project_path, "*.xcodeproj")) or glob.glob(os.path.join(project_path, "*.xcworkspace")):
+        project_type = "iOS/macOS (Swift/Objective-C)"
+    # Additional check for Xcode projects that might be in subdirectories
+    else:
+        for root, dirs, _ in os.walk(project_path):
+            if any(d.endswith('.xcodeproj') or d.endswith('.xcworkspace') for d in dirs):
+                project_type = "iOS/macOS (Swift/Objective-C)"
+                break
+            if glob.glob(os.path.join(root, '*.swift')):
+                project_type = "iOS/macOS (Swift)"
+                break
+    
+    # Detect primary language
+    language = "Unknown"
+    ext_counts = {}
+    sniff_samples = {}
+    
+    # One walk feeds language counts, content-sniffing samples and the size report
+    size_report = SizeReport(max_file_size)
+    for rel_path, entry in walk_files(project_path):
+        _, ext = os.path.splitext(entry.name.lower())
+        if ext in LANG_MAP:
+            ext_counts[ext] = ext_counts.get(ext, 0) + 1
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+        if ext in AMBIGUOUS_EXTENSIONS and len(sniff_samples.setdefault(ext, [])) < SNIFF_SAMPLE:
+            sniff_samples[ext].append((entry.path, st))
+        size_report.add(rel_path, entry.path, ext, st.st_size)
+    size_info = size_report.to_dict()
+    
+    # Extensions shared by several languages are settled by sniffing a few files
+    ext_languages = dict(LANG_MAP)
+    ext_languages.update(resolve_languages(sniff_samples, cache))
+    
+    lang_counts = {}
+    for ext, count in ext_counts.items():
+        lang_counts[ext_languages[ext]] = lang_counts.get(ext_languages[ext], 0) + count
+    if lang_counts:
+        language = max(lang_counts, key=lambda k: lang_counts.get(k, 0))
+    
+    # Get last modified date
+    last_modified = "Unknown"
+    project_stat = None
+    try:
+        project_stat = os.stat(project_path)
+        last_modified = datetime.datetime.fromtimestamp(project_stat.st_mtime).strftime("%Y-%m-%d")
+    except:
+        pass
+    
+    # Get status based on last modified date
+    status = "Active"  # Default to active
+    
+    # Check if README exists
+    readme_exists = False
+    for readme_name in ["README.md", "Readme.md", "readme.md", "README.txt", "README"]:
+        if os.path.exists(os.path.join(project_path, readme_name)):
+            readme_exists = True
+            break
+    
+    # Get description from README if it exists
+    description = "No description available."
+    readme_stamp = None
+    if readme_exists:
+        readme_files = glob.glob(os.path.join(project_path, "README*"))
+        if readme_files:
+            try:
+                readme_stat = os.stat(readme_files[0])
+                readme_stamp = (readme_stat.st_mtime_ns, readme_stat.st_size)
+                with open(readme_files[0], 'r', encoding='utf-8', errors='ignore') as f:
+                    readme_content = f.read()
+                
+                # Keep the full-text index in step with the README
+                if search_index is not None:
+                    search_index.update(project_path, project_name, readme_files[0], readme_content)
+                
+                # Look for a description section
+                overview_match = re.search(r'#+\s*(?:Project\s+Overview|Overview|About|Description|Introduction)\s*\n+(.+?)(?:\n#+|\n\n|$)', 
+                                         readme_content, re.DOTALL | re.IGNORECASE)
+                if overview_match:
+                    description = overview_match.group(1).strip()
+                else:
+                    # Find first substantial paragraph
+                    paragraphs = re.findall(r'\n\n([^#\n][^\n]{30,})', readme_content, re.DOTALL)
+                    if paragraphs:
+                        description = paragraphs[0].strip()
+            except:
+                pass
+    
+    if search_index is not None and not readme_exists:
+        search_index.remove(project_path)
+    
+    # Generate README if requested and none exists
+    if generate_readme_flag and not readme_exists:
+        readme_path = os.path.join(project_path, "README.md")
+        logger.info(f"  Generating README.md for {project_name}")
+        
+        project_info = {
+            'name': project_name,
+            'path': project_path,
+            'type': project_type,
+            'language': language
+        }
+        
+        generate_readme(project_info, readme_path)
+        
+        # Update description from the new README
+        try:
+            with open(readme_path, 'r', encoding='utf-8') as f:
+                description = "This is a generated README."
+        except:
+            pass
+    
+    # Preview what the .gitignore template would exclude, before it is written
+    gitignore_preview = None
+    if preview_gitignore_flag:
+        gitignore_preview = preview_gitignore(project_path, get_gitignore_template(language, project_type))
+        logger.info(f"  .gitignore preview for {project_name}: {gitignore_preview['excluded_files']} files "
+                    f"({format_size(gitignore_preview['excluded_bytes'])}) excluded, "
+                    f"{gitignore_preview['tracked_ignored']} tracked files would be ignored")
+    
+    # Generate .gitignore if requested
+    if generate_gitignore_flag:
+        generate_gitignore(project_path, language, project_type)
+    
+    # Oversized files the .gitignore now in place excludes are never committed, so only the rest count
+    size_info['oversized_ignored'] = []
+    if size_info['oversized']:
+        size_info['oversized'], size_info['oversized_ignored'] = split_ignored(
+            project_path, [path.replace(os.sep, '/') for path in size_info['oversized']])
+        if size_info['oversized_ignored']:
+            logger.info(f"  {len(size_info['oversized_ignored'])} file(s) over {format_size(max_file_size)} "
+                        f"in {project_name} are excluded by .gitignore: {', '.join(size_info['oversized_ignored'][:3])}")
+    
+    # Warn about files too large to push before any git operations run
+    if size_info['oversized']:
+        action = "skipping git operations" if skip_large else "git operations may fail"
+        logger.warning(f"  {len(size_info['oversized'])} file(s) over {format_size(max_file_size)} "
+                       f"in {project_name} ({action}): {', '.join(size_info['oversized'][:3])}")
+    
+    # Initialize git repo if requested
+    if init_git_flag and not (skip_large and size_info['oversized']):
+        init_git_repo(project_path)
+    
+    # Read declared dependencies from manifests
+    dependencies = None
+    if dependencies_flag:
+        dependencies = read_dependencies(project_path, cache)
+    
+    # Collect commit activity metrics
+    git_metrics = None
+    git_head = None
+    if git_metrics_flag:
+        # HEAD is resolved once and shared by the metrics lookup and the fingerprint
+        git_head = read_git_head(project_path)
+        git_metrics = get_git_metrics(project_path, cache, git_head) if git_head else None
+    
+    # Cheap stamp of what the scan saw, from stat data, README and HEAD; the HTML
+    # index reuses a project's rendered row while its fingerprint is unchanged
+    largest = size_info['largest'][0] if size_info['largest'] else {}
+    fingerprint = hashlib.blake2b(repr((
+        project_stat and project_stat.st_mtime_ns, last_modified, project_type, language, readme_stamp,
+        description if readme_stamp is None else None, git_head, git_metrics and git_metrics['active_authors'],
+        size_info['total_bytes'], size_info['file_count'], size_info['binary_count'],
+        largest.get('path'), largest.get('bytes'), len(size_info['oversized'])
+    )).encode('utf-8', 'surrogateescape'), digest_size=12).hexdigest()
+    
+    return {
+        'name': project_name,
+        'path': project_path,
+        'type': project_type, 
+        'language': language,
+        'status': status,
+        'last_modified': last_modified,
+        'description': description,
+        'git': git_metrics,
+        'size': size_info,
+        'gitignore_preview': gitignore_preview,
+        'dependencies': dependencies,
+        'fingerprint': fingerprint
+    }
+
+def refresh_readme_index(project_path, search_index):
+    """Bring a project's README search entry up to date without scanning the project."""
+    readme_files = glob.glob(os.path.join(project_path, "README*"))
+    if not readme_files:
+        search_index.remove(project_path)
+        return
+    try:
+        with open(readme_files[0], 'r', encoding='utf-8', errors='ignore') as f:
+            search_index.update(project_path, os.path.basename(project_path), readme_files[0], f.read())
+    except OSError:
+        pass
+
+def discover_projects(roots):
+    """List project directories directly under each root, skipping hidden entries."""
+    if isinstance(roots, (str, os.PathLike)):
+        roots = [roots]
+    
+    project_paths = []
+    for root in roots:
+        root = os.path.expanduser(root)
+        for item in os.listdir(root):
+            item_path = os.path.join(root, item)
+            if os.path.isdir(item_path) and not item.startswith('.'):
+                project_paths.append(item_path)
+    return project_paths
+
+def iter_projects(roots, generate_readme=False, generate_gitignore=False, init_git=False, git_metrics=True,
+                  cache=None, progress=None, on_event=None, max_file_size=DEFAULT_MAX_FILE_SIZE, skip_large=False,
+                  preview_gitignore=False, search_index=None, dependencies=True, completed=None):
+    """Scan every project under the given roots, yielding one record per project as it completes.
+    
+    roots may be a single directory or a list of directories. cache is any object with
+    get/set/save methods (see codedoc.cache); it is not saved here, so callers decide when
+    to persist it. progress is called as progress(done, total, record) after each project,
+    and on_event as on_event(name, data) for 'scan_start', 'project_start', 'project_done'
+    and 'scan_done'. Projects with files over max_file_size are reported; with skip_large
+    they are also left out of git initialization. preview_gitignore adds a dry-run report of
+    what the .gitignore template would exclude. search_index, a codedoc.search.ReadmeIndex,
+    is updated with each README read; like the cache, saving it is left to the caller.
+    dependencies controls reading declared dependencies from manifests. completed maps
+    absolute project paths to records from an earlier run (see codedoc.checkpoint); those
+    projects are yielded as recorded instead of being scanned again, with only their README
+    search entries refreshed.
+    """
+    def emit(name, data):
+        if on_event:
+            on_event(name, data)
+    
+    project_paths = discover_projects(roots)
+    total = len(project_paths)
+    emit('scan_start', {'total': total})
+    
+    for done, project_path in enumerate(project_paths, 1):
+        if completed and os.path.abspath(project_path) in completed:
+            record = completed[os.path.abspath(project_path)]
+            # The interrupted run's index changes may not have been committed
+            if search_index is not None:
+                refresh_readme_index(project_path, search_index)
+            emit('project_done', {'record': record, 'resumed': True})
+            if progress:
+                progress(done, total, record)
+            yield record
+            continue
+        
+        emit('project_start', {'path': project_path})
+        record = scan_project(project_path, generate_readme, generate_gitignore, init_git, git_metrics, cache,
+                              max_file_size, skip_large, preview_gitignore, search_index, dependencies)
+        emit('project_done', {'record': record})
+        if progress:
+            progress(done, total, record)
+        yield record
+    
+    emit('scan_done', {'total': total})
@@ -0,0 +1,104 @@
+"""
+Full-text search over project READMEs
+
+READMEs read during the scan are stored in an SQLite FTS5 table and ranked
+with BM25. Each entry remembers the README's mtime and size, so rescans
+only re-tokenize READMEs that changed.
+"""
+
+import os
+import re
+import sqlite3
+
+DEFAULT_SEARCH_INDEX = '.codedoc-search.db'
+
+# BM25 column weights for (name, path, content): matches in the project name rank higher
+BM25_WEIGHTS = (5.0, 0.0, 1.0)
+
+class ReadmeIndex:
+    """Persistent inverted index of project READMEs."""
+
+    def __init__(self, path=DEFAULT_SEARCH_INDEX):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS readmes (
+                id INTEGER PRIMARY KEY,
+                project_path TEXT UNIQUE NOT NULL,
+                readme_path TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS readme_fts USING fts5(
+                name, project_path UNINDEXED, content, tokenize='porter unicode61'
+            );
+        ''')
+
+    def update(self, project_path, name, readme_path, content):
+        """Index a project's README unless the stored copy is still current."""
+        project_path = os.path.abspath(project_path)
+        try:
+            st = os.stat(readme_path)
+        except OSError:
+            return False
+
+        row = self.conn.execute('SELECT id, readme_path, mtime_ns, size FROM readmes WHERE project_path = ?',
+                                (project_path,)).fetchone()
+        if row and row[1:] == (readme_path, st.st_mtime_ns, st.st_size):
+            return False
+
+        if row:
+            self.conn.execute('DELETE FROM readme_fts WHERE rowid = ?', (row[0],))
+            self.conn.execute('UPDATE readmes SET readme_path = ?, mtime_ns = ?, size = ? WHERE id = ?',
+                              (readme_path, st.st_mtime_ns, st.st_size, row[0]))
+            rowid = row[0]
+        else:
+            rowid = self.conn.execute('INSERT INTO readmes (project_path, readme_path, mtime_ns, size) VALUES (?, ?, ?, ?)',
+                                      (project_path, readme_path, st.st_mtime_ns, st.st_size)).lastrowid
+        self.conn.execute('INSERT INTO readme_fts (rowid, name, project_path, content) VALUES (?, ?, ?, ?)',
+                          (rowid, name, project_path, content))
+        return True
+
+    def remove(self, project_path):
+        """Drop a project from the index."""
+        project_path = os.path.abspath(project_path)
+        row = self.conn.execute('SELECT id FROM readmes WHERE project_path = ?', (project_path,)).fetchone()
+        if row:
+            self.conn.execute('DELETE FROM readme_fts WHERE rowid = ?', (row[0],))
+            self.conn.execute('DELETE FROM readmes WHERE id = ?', (row[0],))
+
+    def prune(self, roots, project_paths):
+        """Drop projects under the given roots that were not seen in the latest scan."""
+        roots = [os.path.abspath(root) for root in roots]
+        keep = {os.path.abspath(p) for p in project_paths}
+        for (project_path,) in self.conn.execute('SELECT project_path FROM readmes').fetchall():
+            if project_path not in keep and os.path.dirname(project_path) in roots:
+                self.remove(project_path)
+
+    def search(self, query, limit=20):
+        """Return the best matching projects for a query, most relevant first."""
+        sql = f'''
+            SELECT name, project_path, bm25(readme_fts, {", ".join(map(str, BM25_WEIGHTS))}) AS score,
+                   snippet(readme_fts, 2, '[', ']', '...', 12)
+            FROM readme_fts WHERE readme_fts MATCH ? ORDER BY score LIMIT ?
+        '''
+        try:
+            rows = self.conn.execute(sql, (query, limit)).fetchall()
+        except sqlite3.OperationalError:
+            # Not valid FTS syntax: search for the words as plain terms
+            terms = re.findall(r'\w+', query)
+            if not terms:
+                return []
+            rows = self.conn.execute(sql, (' '.join(f'"{t}"' for t in terms), limit)).fetchall()
+
+        return [{'name': name, 'path': path, 'score': -score, 'snippet': snippet}
+                for name, path, score, snippet in rows]
+
+    def save(self):
+        """Commit pending changes."""
+        self.conn.commit()
+
+    def close(self):
+        """Commit pending changes and close the database."""
+        self.conn.commit()
+        self.conn.close()
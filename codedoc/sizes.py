@@ -0,0 +1,115 @@
+"""
+Per-project size report: total size, largest files and binary blobs
+
+Sizes come from the stat data gathered while walking the project. Binary
+detection uses the file extension when it is conclusive and otherwise
+sniffs a small header for NUL bytes.
+"""
+
+import os
+import heapq
+
+# GitHub rejects pushes containing files over 100 MB
+DEFAULT_MAX_FILE_SIZE = 100 * 1024 * 1024
+
+# Number of largest files kept in the report
+LARGEST_FILES = 10
+
+# Bytes read from the start of a file to decide whether it is binary
+SNIFF_BYTES = 1024
+
+TEXT_EXTENSIONS = {
+    '.txt', '.md', '.rst', '.json', '.yml', '.yaml', '.xml', '.toml', '.ini', '.cfg', '.conf',
+    '.csv', '.tsv', '.html', '.htm', '.css', '.scss', '.js', '.jsx', '.ts', '.tsx', '.py',
+    '.java', '.kt', '.go', '.rs', '.sh', '.c', '.h', '.cpp', '.hpp', '.cs', '.rb', '.php',
+    '.swift', '.m', '.sql', '.lua', '.r', '.scala', '.clj', '.ex', '.exs', '.erl', '.dart',
+    '.lock', '.gradle', '.properties', '.svg'
+}
+
+BINARY_EXTENSIONS = {
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp', '.tif', '.tiff', '.psd',
+    '.pdf', '.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.rar', '.tar', '.jar', '.war',
+    '.ear', '.class', '.so', '.dylib', '.dll', '.exe', '.o', '.a', '.lib', '.obj', '.pyc',
+    '.whl', '.egg', '.mp3', '.mp4', '.mov', '.avi', '.wav', '.flac', '.ogg', '.mkv',
+    '.ttf', '.otf', '.woff', '.woff2', '.eot', '.db', '.sqlite', '.sqlite3', '.parquet',
+    '.npy', '.npz', '.h5', '.hdf5', '.pkl', '.pt', '.onnx', '.bin', '.dat', '.iso', '.dmg'
+}
+
+def is_binary_file(path, ext, size):
+    """Decide whether a file is binary from its extension, or failing that from its first bytes."""
+    if ext in BINARY_EXTENSIONS:
+        return True
+    if ext in TEXT_EXTENSIONS or size == 0:
+        return False
+    try:
+        with open(path, 'rb') as f:
+            return b'\0' in f.read(SNIFF_BYTES)
+    except OSError:
+        return False
+
+class SizeReport:
+    """Accumulates size statistics for the files of one project."""
+
+    def __init__(self, max_file_size=DEFAULT_MAX_FILE_SIZE):
+        self.max_file_size = max_file_size
+        self.total_bytes = 0
+        self.file_count = 0
+        self.binary_count = 0
+        self.binary_bytes = 0
+        self.largest = []
+        self.oversized = []
+
+    def add(self, rel_path, full_path, ext, size):
+        """Record one file."""
+        self.total_bytes += size
+        self.file_count += 1
+        if is_binary_file(full_path, ext, size):
+            self.binary_count += 1
+            self.binary_bytes += size
+        if size > self.max_file_size:
+            self.oversized.append(rel_path)
+
+        # Keep a bounded min-heap of the largest files
+        if len(self.largest) < LARGEST_FILES:
+            heapq.heappush(self.largest, (size, rel_path))
+        elif size > self.largest[0][0]:
+            heapq.heapreplace(self.largest, (size, rel_path))
+
+    def to_dict(self):
+        """Return the report as a JSON-serializable dict."""
+        return {
+            'total_bytes': self.total_bytes,
+            'file_count': self.file_count,
+            'binary_count': self.binary_count,
+            'binary_bytes': self.binary_bytes,
+            'largest': [{'path': path, 'bytes': size} for size, path in sorted(self.largest, reverse=True)],
+            'oversized': sorted(self.oversized)
+        }
+
+def walk_files(project_path):
+    """Yield (relative path, DirEntry) for every regular file in a project, skipping .git."""
+    stack = [project_path]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != '.git':
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield os.path.relpath(entry.path, project_path), entry
+                except OSError:
+                    continue
+
+def format_size(num_bytes):
+    """Format a byte count for display."""
+    size = float(num_bytes)
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if size < 1024 or unit == 'GB':
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
@@ -0,0 +1,277 @@
+"""
+Tests for the GitHub client against a local http.server stand-in for the API
+
+Nothing here touches the network: each test starts a threaded HTTP/1.1
+server on 127.0.0.1 whose responses are scripted per test, and time.sleep
+in codedoc.github is replaced so backoff is recorded rather than waited.
+"""
+
+import os
+import json
+import time
+import base64
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from codedoc import git, github
+from codedoc.github import GitHubClient, GitHubError, create_github_repos
+
+class FakeGitHub:
+    """Scripted GitHub API served over keep-alive HTTP/1.1 connections.
+
+    handle(method, path, body) returns (status, headers, json body), or None to
+    drop the connection without answering.
+    """
+
+    def __init__(self, handle):
+        self.handle = handle
+        self.requests = []
+        self.clients = set()
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, *args):
+                pass
+
+            def _serve(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                fake.requests.append((self.command, self.path, body))
+                fake.clients.add(self.client_address)
+                reply = fake.handle(self.command, self.path, body)
+                if reply is None:
+                    self.close_connection = True
+                    return
+                status, headers, data = reply
+                payload = json.dumps(data).encode('utf-8')
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = _serve
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}'
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+class GitHubTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.sleeps = []
+        patcher = mock.patch.object(github.time, 'sleep', self.sleeps.append)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def serve(self, handle, concurrency=2):
+        fake = FakeGitHub(handle)
+        self.addCleanup(fake.close)
+        client = GitHubClient('test-token', api_url=fake.url, concurrency=concurrency, timeout=5)
+        self.addCleanup(client.close)
+        return fake, client
+
+class RequestTests(GitHubTestCase):
+
+    def test_list_repo_names_follows_link_pagination(self):
+        def handle(method, path, body):
+            if 'page=2' in path:
+                return 200, {}, [{'name': 'Gamma'}]
+            link = f'<{fake.url}/user/repos?per_page=100&affiliation=owner&page=2>; rel="next"'
+            return 200, {'Link': link}, [{'name': 'Alpha'}, {'name': 'beta'}]
+
+        fake, client = self.serve(handle)
+        self.assertEqual(client.list_repo_names(), {'alpha', 'beta', 'gamma'})
+        self.assertEqual([path for _, path, _ in fake.requests], [
+            '/user/repos?per_page=100&affiliation=owner',
+            '/user/repos?per_page=100&affiliation=owner&page=2'
+        ])
+
+    def test_429_waits_for_retry_after(self):
+        replies = iter([(429, {'Retry-After': '7'}, {'message': 'slow down'}), (200, {}, {'login': 'me'})])
+        fake, client = self.serve(lambda method, path, body: next(replies))
+
+        status, _, data = client.request('GET', '/user')
+        self.assertEqual((status, data), (200, {'login': 'me'}))
+        self.assertEqual(len(fake.requests), 2)
+        self.assertEqual(self.sleeps, [7])
+
+    def test_403_with_exhausted_rate_limit_waits_for_reset(self):
+        reset = int(time.time()) + 30
+        replies = iter([
+            (403, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': str(reset)}, {'message': 'rate limit'}),
+            (200, {'X-RateLimit-Remaining': '4999'}, {'login': 'me'})
+        ])
+        fake, client = self.serve(lambda method, path, body: next(replies))
+
+        status, _, _ = client.request('GET', '/user')
+        self.assertEqual(status, 200)
+        self.assertEqual(len(fake.requests), 2)
+        # The retry is held back until just past the reset time
+        self.assertEqual(len(self.sleeps), 1)
+        self.assertGreater(self.sleeps[0], 25)
+
+    def test_connections_are_reused(self):
+        fake, client = self.serve(lambda method, path, body: (200, {}, {'ok': True}), concurrency=2)
+        for _ in range(6):
+            self.assertEqual(client.request('GET', '/user')[0], 200)
+        self.assertEqual(len(fake.requests), 6)
+        self.assertEqual(len(fake.clients), 1)
+
+    def test_dropped_connection_retries_with_backoff(self):
+        replies = iter([None, None, (200, {}, {'login': 'me'})])
+        fake, client = self.serve(lambda method, path, body: next(replies))
+
+        self.assertEqual(client.request('GET', '/user')[0], 200)
+        self.assertEqual(len(fake.requests), 3)
+        self.assertEqual(self.sleeps, [1, 2])
+
+    def test_post_is_not_resent_after_server_error(self):
+        fake, client = self.serve(lambda method, path, body: (502, {}, {'message': 'bad gateway'}))
+        status, _, _ = client.request('POST', '/user/repos', {'name': 'x'})
+        self.assertEqual(status, 502)
+        self.assertEqual(len(fake.requests), 1)
+
+class CreateRepoTests(GitHubTestCase):
+
+    def test_create_confirms_unknown_outcome_instead_of_resending(self):
+        repos = {}
+
+        def handle(method, path, body):
+            if method == 'POST':
+                # The repository is created, but the response never arrives
+                repos[body['name']] = {'name': body['name'], 'clone_url': f"https://example.test/me/{body['name']}.git"}
+                return None
+            if path == '/user':
+                return 200, {}, {'login': 'me'}
+            name = path.rsplit('/', 1)[1]
+            return (200, {}, repos[name]) if name in repos else (404, {}, {'message': 'Not Found'})
+
+        fake, client = self.serve(handle)
+        repo = client.create_repo('widget')
+        self.assertEqual(repo['name'], 'widget')
+        self.assertEqual([(m, p) for m, p, _ in fake.requests], [
+            ('POST', '/user/repos'), ('GET', '/user'), ('GET', '/repos/me/widget')
+        ])
+
+    def test_create_resends_only_after_confirming_repo_is_missing(self):
+        replies = iter([(503, {}, {'message': 'unavailable'}), (201, {}, {'name': 'widget', 'clone_url': 'x'})])
+
+        def handle(method, path, body):
+            if method == 'POST':
+                return next(replies)
+            if path == '/user':
+                return 200, {}, {'login': 'me'}
+            return 404, {}, {'message': 'Not Found'}
+
+        fake, client = self.serve(handle)
+        self.assertEqual(client.create_repo('widget')['name'], 'widget')
+        self.assertEqual([m for m, _, _ in fake.requests].count('POST'), 2)
+
+    def test_create_reports_client_errors(self):
+        fake, client = self.serve(lambda method, path, body: (422, {}, {'message': 'name already exists'}))
+        with self.assertRaises(GitHubError) as raised:
+            client.create_repo('widget')
+        self.assertEqual(raised.exception.status, 422)
+        self.assertEqual(len(fake.requests), 1)
+
+class CreateGitHubReposTests(GitHubTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def make_project(self, name, git=True, remote=None):
+        path = os.path.join(self.root, name)
+        os.makedirs(path)
+        if git:
+            os.makedirs(os.path.join(path, '.git'))
+            with open(os.path.join(path, '.git', 'config'), 'w', encoding='utf-8') as f:
+                if remote:
+                    f.write(f'[remote "origin"]\n\turl = {remote}\n')
+        return {'name': name, 'path': path}
+
+    def serve_creation(self):
+        def handle(method, path, body):
+            if method == 'GET':
+                return 200, {}, [{'name': 'existing'}]
+            return 201, {}, {'name': body['name'], 'clone_url': f"https://example.test/me/{body['name']}.git",
+                             'ssh_url': f"git@example.test:me/{body['name']}.git"}
+
+        return self.serve(handle)
+
+    def create(self, projects, client, protocol='https'):
+        pushed = []
+
+        def push(path, url, config=None):
+            pushed.append((path, url, config))
+            return True
+
+        with mock.patch.object(github, 'get_git_protocol', lambda host: protocol), \
+                mock.patch.object(github, 'push_new_remote', push):
+            created = create_github_repos(projects, private=True, client=client)
+        return created, pushed
+
+    def test_skips_existing_repositories(self):
+        fake, client = self.serve_creation()
+        projects = [
+            self.make_project('Existing'),
+            self.make_project('has-remote', remote='git@example.test:me/has-remote.git'),
+            self.make_project('not-git', git=False),
+            self.make_project('fresh')
+        ]
+        created, pushed = self.create(projects, client)
+
+        self.assertEqual(created, ['fresh'])
+        self.assertEqual([body for method, _, body in fake.requests if method == 'POST'],
+                         [{'name': 'fresh', 'private': True}])
+        self.assertEqual([(path, url) for path, url, _ in pushed],
+                         [(projects[3]['path'], 'https://example.test/me/fresh.git')])
+
+    def test_https_push_sends_token_outside_the_remote_url(self):
+        fake, client = self.serve_creation()
+        created, pushed = self.create([self.make_project('fresh')], client)
+
+        (_, url, config), = pushed
+        self.assertEqual(url, 'https://example.test/me/fresh.git')
+        header = config['http.https://example.test/.extraheader']
+        self.assertEqual(base64.b64decode(header.split()[-1]).decode(), 'x-access-token:test-token')
+
+    def test_ssh_protocol_pushes_to_ssh_url(self):
+        fake, client = self.serve_creation()
+        created, pushed = self.create([self.make_project('fresh')], client, protocol='ssh')
+        self.assertEqual([(url, config) for _, url, config in pushed], [('git@example.test:me/fresh.git', None)])
+
+class PushTests(unittest.TestCase):
+
+    def test_push_never_prompts_and_keeps_config_out_of_argv(self):
+        calls = []
+        with mock.patch.object(git.subprocess, 'run', lambda cmd, **kwargs: calls.append((cmd, kwargs))):
+            self.assertTrue(git.push_new_remote('/tmp/p', 'https://example.test/me/p.git',
+                                                config={'http.extraheader': 'Authorization: secret'}))
+
+        (add_cmd, _), (push_cmd, push_kwargs) = calls
+        self.assertEqual(add_cmd[-1], 'https://example.test/me/p.git')
+        self.assertNotIn('secret', ' '.join(add_cmd + push_cmd))
+        env = push_kwargs['env']
+        self.assertEqual(env['GIT_TERMINAL_PROMPT'], '0')
+        count = int(env['GIT_CONFIG_COUNT'])
+        self.assertEqual(env[f'GIT_CONFIG_VALUE_{count - 1}'], 'Authorization: secret')
+
+if __name__ == '__main__':
+    unittest.main()